@@ -1,7 +1,9 @@
+import sys
+import time
 import traceback
-from contextlib import asynccontextmanager
+from collections import deque
 from contextvars import ContextVar
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from functools import wraps
 from typing import Any
@@ -15,24 +17,80 @@ _current_connection: ContextVar[asyncpg.Connection | None] = ContextVar(
 _db_pools: dict[str, asyncpg.Pool] = {}
 
 
+class _LoggedAt:
+    """Descriptor backing ``QueryLog.timestamp``.
+
+    When no timestamp is given, the log time is recorded as integer nanoseconds
+    and only turned into a datetime the first time it is read.
+    """
+
+    def __get__(self, obj: "QueryLog | None", objtype: type | None = None):
+        if obj is None:
+            return None
+        if isinstance(obj._timestamp, int):
+            seconds = obj._timestamp / 1_000_000_000
+            obj._timestamp = datetime.fromtimestamp(seconds, UTC)
+        return obj._timestamp
+
+    def __set__(self, obj: "QueryLog", value: datetime | None) -> None:
+        obj._timestamp = time.time_ns() if value is None else value
+
+
+class _StackTrace:
+    """Descriptor backing ``QueryLog.stack_trace``.
+
+    Accepts formatted text or a captured StackSummary; a StackSummary is only
+    formatted the first time it is read.
+    """
+
+    def __get__(self, obj: "QueryLog | None", objtype: type | None = None):
+        if obj is None:
+            return None
+        if isinstance(obj._stack_trace, traceback.StackSummary):
+            obj._stack_trace = "".join(obj._stack_trace.format())
+        return obj._stack_trace
+
+    def __set__(
+        self, obj: "QueryLog", value: str | traceback.StackSummary | None
+    ) -> None:
+        obj._stack_trace = value
+
+
 @dataclass
 class QueryLog:
     """Represents a logged query"""
 
+    __slots__ = ("query", "params", "_timestamp", "_stack_trace")
+
     query: str
     params: list[Any]
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
-    stack_trace: str | None = None
+    timestamp: datetime = _LoggedAt()
+    stack_trace: str | None = _StackTrace()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the log entry to a dictionary with an ISO formatted timestamp"""
+        return {
+            "query": self.query,
+            "params": self.params,
+            "timestamp": self.timestamp.isoformat(),
+            "stack_trace": self.stack_trace,
+        }
 
     def __repr__(self) -> str:
         return f"QueryLog(query={self.query!r}, params={self.params!r}, timestamp={self.timestamp}, stack_trace={self.stack_trace!r})"
 
 
 class QueryTracker:
-    """Tracks queries executed during a context"""
+    """Tracks queries executed during a context.
+
+    With ``max_queries`` set, only the most recent ``max_queries`` entries are
+    kept, which bounds memory for long-running tracked transactions.
+    """
+
+    __slots__ = ("queries", "_enabled")
 
-    def __init__(self):
-        self.queries: list[QueryLog] = []
+    def __init__(self, max_queries: int | None = None):
+        self.queries: deque[QueryLog] = deque(maxlen=max_queries)
         self._enabled: bool = False
 
     def enable(self):
@@ -47,7 +105,12 @@ class QueryTracker:
         """Check if query tracking is enabled"""
         return self._enabled
 
-    def log_query(self, query: str, params: list[Any], stack_trace: str | None = None):
+    def log_query(
+        self,
+        query: str,
+        params: list[Any],
+        stack_trace: str | traceback.StackSummary | None = None,
+    ):
         """Log a query with its parameters and optional stack trace"""
         if self._enabled:
             self.queries.append(
@@ -56,7 +119,7 @@ class QueryTracker:
 
     def get_queries(self) -> list[QueryLog]:
         """Get all logged queries"""
-        return self.queries.copy()
+        return list(self.queries)
 
     def clear(self):
         """Clear all logged queries"""
@@ -66,17 +129,17 @@ class QueryTracker:
         """Get the number of logged queries"""
         return len(self.queries)
 
+    def __len__(self) -> int:
+        """Get the number of logged queries"""
+        return len(self.queries)
+
+    def __bool__(self) -> bool:
+        """Always true, so `if tracker:` still means a tracker is present"""
+        return True
+
     def to_dict(self) -> list[dict[str, Any]]:
         """Convert logged queries to a list of dictionaries"""
-        return [
-            {
-                "query": log.query,
-                "params": log.params,
-                "timestamp": log.timestamp.isoformat(),
-                "stack_trace": log.stack_trace,
-            }
-            for log in self.queries
-        ]
+        return [log.to_dict() for log in self.queries]
 
 
 # Context variable to store the query tracker
@@ -114,60 +177,61 @@ class DatabaseManager:
     def log_query(cls, query: str, params: list[Any]):
         """Log a query to the current query tracker if available"""
         tracker = _query_tracker.get()
-        if tracker:
-            # Capture stack trace, skipping the current frame and the DatabaseOperations frame
-            stack = traceback.extract_stack()
-            # Skip the last 2 frames: this method and the DatabaseOperations method
-            relevant_stack = stack[:-2]
-            stack_trace = "".join(traceback.format_list(relevant_stack))
-            tracker.log_query(query, params, stack_trace)
+        # A disabled tracker drops the entry, so skip capturing the stack for it
+        if tracker and tracker.is_enabled():
+            # Capture the stack, skipping this method and the DatabaseOperations
+            # method. Source lines are read and formatted only if the trace is used.
+            stack = traceback.StackSummary.extract(
+                traceback.walk_stack(sys._getframe(2)), lookup_lines=False
+            )
+            stack.reverse()
+            tracker.log_query(query, params, stack)
 
     @classmethod
-    @asynccontextmanager
-    async def transaction(cls, db_name: str = "default", track_queries: bool = False):
+    def transaction(
+        cls,
+        db_name: str = "default",
+        track_queries: bool = False,
+        max_tracked_queries: int | None = None,
+    ) -> "_TransactionContext":
         """Context manager for database transactions.
 
         Behavior:
         - If called within an existing transaction/connection, it opens a nested transaction using the same connection.
-        - Otherwise it acquires a connection from the asyncpg pool using `async with pool.acquire()` and starts a transaction.
+        - Otherwise it acquires a connection from the asyncpg pool using `pool.acquire()` and starts a transaction.
         - The connection acquired from the pool is always released back to the pool when the context exits,
-          regardless of whether it exits normally or due to an exception. This is guaranteed by the async
-          context manager (`__aexit__`) of asyncpg's Pool.acquire.
+          regardless of whether it exits normally or due to an exception. The release is delegated to the
+          async context manager (`__aexit__`) of asyncpg's Pool.acquire.
 
         Args:
             db_name: Name of the database pool to use
             track_queries: Whether to enable query tracking for this transaction
+            max_tracked_queries: Keep only this many most recent queries in the
+                tracker (unbounded by default)
         """
-        current_conn = _current_connection.get()
-        current_tracker = _query_tracker.get()
+        return _TransactionContext(db_name, track_queries, max_tracked_queries)
 
-        # If a connection already exists, use nested transaction
-        if current_conn:
-            async with current_conn.transaction():
-                yield current_conn
-        else:
-            # Create a new connection and transaction
-            pool = await cls.get_pool(db_name)
-            async with pool.acquire() as conn, conn.transaction():
-                conn_token = _current_connection.set(conn)
-
-                # Set up query tracker if requested and not already present
-                tracker_token = None
-                if track_queries and not current_tracker:
-                    tracker = QueryTracker()
-                    tracker.enable()
-                    tracker_token = _query_tracker.set(tracker)
-
-                try:
-                    yield conn
-                finally:
-                    _current_connection.reset(conn_token)
-                    if tracker_token:
-                        _query_tracker.reset(tracker_token)
+    @classmethod
+    def tracked_transaction(
+        cls, db_name: str = "default", max_tracked_queries: int | None = None
+    ) -> "_TrackedTransactionContext":
+        """Open a transaction and track its queries in one context manager.
+
+        Equivalent to entering transaction(db_name) and then track_queries():
+
+        async with DatabaseManager.tracked_transaction("default") as tracker:
+            await repo.find_by_id(some_id)
+            queries = tracker.get_queries()
+
+        Args:
+            db_name: Name of the database pool to use
+            max_tracked_queries: Keep only this many most recent queries in the
+                tracker (unbounded by default)
+        """
+        return _TrackedTransactionContext(db_name, False, max_tracked_queries)
 
     @classmethod
-    @asynccontextmanager
-    async def track_queries(cls):
+    def track_queries(cls) -> "_TrackQueriesContext":
         """Context manager specifically for query tracking.
 
         Use this within a transaction to enable query tracking:
@@ -178,34 +242,164 @@ class DatabaseManager:
                 await repo.find_by_id(some_id)
                 queries = tracker.get_queries()
         """
+        return _TrackQueriesContext()
+
+
+class _TransactionContext:
+    """Async context manager returned by DatabaseManager.transaction().
+
+    Written as a plain class rather than an @asynccontextmanager generator, since
+    it is entered for every transactional call. Each instance is single-use.
+    """
+
+    __slots__ = (
+        "_db_name",
+        "_track_queries",
+        "_max_tracked_queries",
+        "_acquire",
+        "_transaction",
+        "_conn_token",
+        "_tracker_token",
+    )
+
+    def __init__(
+        self,
+        db_name: str,
+        track_queries: bool,
+        max_tracked_queries: int | None,
+    ):
+        self._db_name = db_name
+        self._track_queries = track_queries
+        self._max_tracked_queries = max_tracked_queries
+        self._acquire = None
+        self._transaction = None
+        self._conn_token = None
+        self._tracker_token = None
+
+    async def __aenter__(self) -> asyncpg.Connection:
+        current_conn = _current_connection.get()
+
+        # If a connection already exists, use nested transaction
+        if current_conn:
+            self._transaction = current_conn.transaction()
+            await self._transaction.__aenter__()
+            return current_conn
+
+        # Create a new connection and transaction
+        pool = await DatabaseManager.get_pool(self._db_name)
+        self._acquire = pool.acquire()
+        conn = await self._acquire.__aenter__()
+        try:
+            self._transaction = conn.transaction()
+            await self._transaction.__aenter__()
+        except BaseException as exc:
+            await self._acquire.__aexit__(type(exc), exc, exc.__traceback__)
+            raise
+
+        self._conn_token = _current_connection.set(conn)
+
+        # Set up query tracker if requested and not already present
+        if self._track_queries and not _query_tracker.get():
+            tracker = QueryTracker(self._max_tracked_queries)
+            tracker.enable()
+            self._tracker_token = _query_tracker.set(tracker)
+
+        return conn
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self._conn_token is not None:
+            _current_connection.reset(self._conn_token)
+        if self._tracker_token is not None:
+            _query_tracker.reset(self._tracker_token)
+
+        try:
+            await self._transaction.__aexit__(exc_type, exc, tb)
+        finally:
+            if self._acquire is not None:
+                await self._acquire.__aexit__(exc_type, exc, tb)
+        return False
+
+
+class _TrackQueriesContext:
+    """Async context manager returned by DatabaseManager.track_queries().
+
+    Reuses (and enables) the tracker already in context when there is one;
+    otherwise installs a new tracker for the duration of the block.
+    """
+
+    __slots__ = ("_max_queries", "_tracker", "_token", "_was_enabled")
+
+    def __init__(self, max_queries: int | None = None):
+        self._max_queries = max_queries
+        self._tracker: QueryTracker | None = None
+        self._token = None
+        self._was_enabled = False
+
+    async def __aenter__(self) -> QueryTracker:
         current_tracker = _query_tracker.get()
 
         if current_tracker:
             # Already have a tracker, just enable it
-            was_enabled = current_tracker.is_enabled()
+            self._was_enabled = current_tracker.is_enabled()
             current_tracker.enable()
-            try:
-                yield current_tracker
-            finally:
-                if not was_enabled:
-                    current_tracker.disable()
+            self._tracker = current_tracker
         else:
             # Create a new tracker
-            tracker = QueryTracker()
-            tracker.enable()
-            token = _query_tracker.set(tracker)
-            try:
-                yield tracker
-            finally:
-                _query_tracker.reset(token)
-
-
-def transactional(db_name: str = "default", query_logs: bool = False):
+            self._tracker = QueryTracker(self._max_queries)
+            self._tracker.enable()
+            self._token = _query_tracker.set(self._tracker)
+        return self._tracker
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self._token is not None:
+            _query_tracker.reset(self._token)
+        elif not self._was_enabled:
+            self._tracker.disable()
+        return False
+
+
+class _TrackedTransactionContext(_TransactionContext):
+    """Transaction context that also enters query tracking and yields the tracker"""
+
+    __slots__ = ("_tracking",)
+
+    def __init__(
+        self,
+        db_name: str,
+        track_queries: bool,
+        max_tracked_queries: int | None,
+    ):
+        super().__init__(db_name, track_queries, max_tracked_queries)
+        self._tracking = _TrackQueriesContext(max_tracked_queries)
+
+    async def __aenter__(self) -> QueryTracker:  # type: ignore[override]
+        await super().__aenter__()
+        try:
+            return await self._tracking.__aenter__()
+        except BaseException as exc:
+            await super().__aexit__(type(exc), exc, exc.__traceback__)
+            raise
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        try:
+            await self._tracking.__aexit__(exc_type, exc, tb)
+        finally:
+            await super().__aexit__(exc_type, exc, tb)
+        return False
+
+
+def transactional(
+    db_name: str = "default",
+    query_logs: bool = False,
+    max_query_logs: int | None = None,
+):
     """Decorator to run a function within a database transaction.
 
     Args:
         db_name: Name of the database pool to use
         query_logs: Whether to enable query tracking for this transaction
+        max_query_logs: Keep only this many most recent queries in the tracker
+            (unbounded by default)
 
     Example:
         @transactional(query_logs=True)
@@ -220,7 +414,11 @@ def transactional(db_name: str = "default", query_logs: bool = False):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            async with DatabaseManager.transaction(db_name, track_queries=query_logs):
+            async with DatabaseManager.transaction(
+                db_name,
+                track_queries=query_logs,
+                max_tracked_queries=max_query_logs,
+            ):
                 return await func(*args, **kwargs)
 
         return wrapper
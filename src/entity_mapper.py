@@ -6,11 +6,15 @@ from pydantic import BaseModel
 class EntityMapper[T: BaseModel]:
     """Composition class for entity mapping operations"""
 
-    def __init__(self, entity_class: type[T]):
+    def __init__(self, entity_class: type[T], trusted: bool = False):
         self.entity_class = entity_class
+        # Trusted rows are built with model_construct, skipping validation
+        self.trusted = trusted
 
     def map_row_to_entity(self, row: Any) -> T:
         """Map database row to entity"""
+        if self.trusted:
+            return self.entity_class.model_construct(**dict(row))
         return self.entity_class(**dict(row))
 
     def map_rows_to_entities(self, rows: list[Any]) -> list[T]:
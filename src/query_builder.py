@@ -3,12 +3,160 @@ Simple QueryBuilder for building SELECT queries.
 The goal is to produce SQL queries without execution.
 """
 
+import re
+import sys
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from src.entities import Field
 
+# Interned operator vocabulary; conditions reuse these instead of fresh copies
+_OP_INTERN = {
+    op: sys.intern(op)
+    for op in ("=", "!=", "<>", "<", ">", "<=", ">=", "LIKE", "IN", "NOT IN")
+}
+
+
+# "$1".."$256"; placeholders beyond the table are formatted on the fly
+_PLACEHOLDER_CACHE: tuple[str, ...] = tuple(f"${i}" for i in range(1, 257))
+
+
+def _placeholder(index: int) -> str:
+    """Return the ``$index`` placeholder"""
+    if 0 < index <= len(_PLACEHOLDER_CACHE):
+        return _PLACEHOLDER_CACHE[index - 1]
+    return f"${index}"
+
+
+def _placeholders(start: int, count: int) -> str:
+    """Return ``count`` comma-separated placeholders beginning at ``$start``"""
+    end = start - 1 + count
+    if start > 0 and end <= len(_PLACEHOLDER_CACHE):
+        return ", ".join(_PLACEHOLDER_CACHE[start - 1 : end])
+    return ", ".join(_placeholder(i) for i in range(start, end + 1))
+
+
+def _intern_operator(operator: str) -> str:
+    """Return the interned form of a comparison operator"""
+    return _OP_INTERN.get(operator) or sys.intern(operator)
+
+
+def _adjust_placeholders(sql: str, offset: int, max_local: int) -> str:
+    """Shift the ``$N`` placeholders of a condition string by ``offset``.
+
+    Only placeholders numbered up to ``max_local`` are shifted; any other ``$N``
+    is copied unchanged. Scanning with str.find avoids the regex machinery for
+    what is always a ``$`` followed by digits.
+    """
+    parts: list[str] = []
+    start = 0
+    length = len(sql)
+    pos = sql.find("$")
+    while pos != -1:
+        end = pos + 1
+        while end < length and "0" <= sql[end] <= "9":
+            end += 1
+        if end > pos + 1:
+            number = int(sql[pos + 1 : end])
+            if number <= max_local:
+                parts.append(sql[start:pos])
+                parts.append(_placeholder(number + offset))
+                start = end
+        pos = sql.find("$", end)
+
+    if not parts:
+        return sql
+    parts.append(sql[start:])
+    return "".join(parts)
+
+
+# SQL fragments used when rendering a query
+_SELECT = "SELECT "
+_FROM = " FROM "
+_WHERE = " WHERE "
+_AND = " AND "
+_OR = " OR "
+_COMMA = ", "
+_GROUP_BY = " GROUP BY "
+_HAVING = " HAVING "
+_ORDER_BY = " ORDER BY "
+_LIMIT = " LIMIT "
+_OFFSET = " OFFSET "
+
+
+@lru_cache(maxsize=128)
+def _group_template(separator: str, count: int) -> str:
+    """Return a parenthesised format template joining ``count`` conditions"""
+    return "(" + separator.join(["{}"] * count) + ")"
+
+
+@lru_cache(maxsize=512)
+def _compile(fingerprint: tuple) -> str:
+    """Render the SQL text for a builder fingerprint.
+
+    Conditions already carry their numbered ``$N`` placeholders, so the SQL only
+    depends on the structure of the builder and never on the parameter values.
+    Builders sharing the same shape therefore share one compiled string.
+    """
+    (
+        select_fields,
+        table_name,
+        where_conditions,
+        or_where_conditions,
+        group_by_parts,
+        having_conditions,
+        order_by_parts,
+        order_by_clause,
+    ) = fingerprint
+    parts = [_SELECT, select_fields, _FROM, table_name]
+
+    # Build WHERE clause
+    where_parts = []
+
+    if where_conditions:
+        if len(where_conditions) == 1:
+            where_parts.append(where_conditions[0])
+        elif not or_where_conditions:
+            where_parts.append(_AND.join(where_conditions))
+        else:
+            # AND conditions with OR conditions present
+            where_parts.append(
+                _group_template(_AND, len(where_conditions)).format(*where_conditions)
+            )
+
+    if or_where_conditions:
+        if len(or_where_conditions) == 1:
+            where_parts.append(or_where_conditions[0])
+        else:
+            where_parts.append(
+                _group_template(_OR, len(or_where_conditions)).format(
+                    *or_where_conditions
+                )
+            )
+
+    if where_parts:
+        parts.append(_WHERE)
+        parts.append(_OR.join(where_parts))
+
+    if group_by_parts:
+        parts.append(_GROUP_BY)
+        parts.append(_COMMA.join(group_by_parts))
+
+    if having_conditions:
+        parts.append(_HAVING)
+        parts.append(_AND.join(having_conditions))
+
+    if order_by_parts:
+        parts.append(_ORDER_BY)
+        parts.append(_COMMA.join(order_by_parts))
+    elif order_by_clause:
+        parts.append(" ")
+        parts.append(order_by_clause.strip())
+
+    return "".join(parts)
+
 
 class QueryBuilder:
     """
@@ -17,51 +165,96 @@ class QueryBuilder:
     Usage:
         builder = QueryBuilder("posts")
         query, params = builder.select("*").where("id", post_id).build()
+
+    Compiled SQL is cached per builder shape; set ``supports_statement_cache``
+    to False on a subclass to always render from scratch.
+
+    Builders are immutable by default: every fluent call returns a new builder.
+    Pass ``mutable=True`` to have fluent calls update and return the same
+    builder instead, which avoids a copy per step on long chains.
     """
 
-    def __init__(self, table_name: str):
-        self.table_name = table_name
+    __slots__ = (
+        "table_name",
+        "select_fields",
+        "where_conditions",
+        "or_where_conditions",
+        "params",
+        "order_by_clause",
+        "order_by_parts",
+        "group_by_parts",
+        "having_conditions",
+        "select_alias_map",
+        "limit_count",
+        "offset_count",
+        "joins",
+        "table_alias",
+        "_modified_from_clause",
+        "_cached_sql",
+        "_mutable",
+    )
+
+    supports_statement_cache: bool = True
+
+    def __init__(self, table_name: str, mutable: bool = False):
+        # Interned so equal table names compare by identity in _compile() keys
+        self.table_name = sys.intern(table_name)
         self.select_fields = "*"
-        self.where_conditions: list[str] = []
-        self.or_where_conditions: list[str] = []
+        self.where_conditions: tuple[str, ...] = ()
+        self.or_where_conditions: tuple[str, ...] = ()
         self.params: list[Any] = []
         self.order_by_clause = ""
-        self.order_by_parts: list[str] = []
-        self.group_by_parts: list[str] = []
-        self.having_conditions: list[str] = []
+        self.order_by_parts: tuple[str, ...] = ()
+        self.group_by_parts: tuple[str, ...] = ()
+        self.having_conditions: tuple[str, ...] = ()
         self.select_alias_map: dict[str, str] = {}
         self.limit_count: int | None = None
         self.offset_count: int | None = None
         # JOIN support
-        self.joins: list[str] = []
+        self.joins: tuple[str, ...] = ()
         self.table_alias: str | None = None
         self._modified_from_clause: str | None = None
+        # Rendered SQL, filled by the first build() call
+        self._cached_sql: str | None = None
+        self._mutable = mutable
 
     @staticmethod
     def _to_field_name(field: "str | Field") -> str:
         """Convert a field (string or Field object) to its string representation"""
         # Check if it's a Field object by checking for the _column_name attribute
         if hasattr(field, "_column_name"):
-            return str(field._column_name)  # type: ignore[attr-defined]
-        return str(field)
+            return sys.intern(str(field._column_name))  # type: ignore[attr-defined]
+        return sys.intern(str(field))
 
     def _clone(self) -> "QueryBuilder":
-        """Create a copy of the current QueryBuilder instance"""
-        new_builder = QueryBuilder(self.table_name)
+        """Create a copy of the current QueryBuilder instance.
+
+        Clause parts are stored as tuples and shared with the copy as-is; only
+        the params list and alias map are copied. __init__ is skipped entirely.
+
+        Mutable builders return themselves, so the caller updates them in place.
+        """
+        if self._mutable:
+            self._cached_sql = None
+            return self
+        new_builder = object.__new__(type(self))
+        new_builder.table_name = self.table_name
         new_builder.select_fields = self.select_fields
-        new_builder.where_conditions = self.where_conditions.copy()
-        new_builder.or_where_conditions = self.or_where_conditions.copy()
-        new_builder.params = self.params.copy()
+        new_builder.where_conditions = self.where_conditions
+        new_builder.or_where_conditions = self.or_where_conditions
+        new_builder.params = self.params[:]
         new_builder.order_by_clause = self.order_by_clause
-        new_builder.order_by_parts = self.order_by_parts.copy()
-        new_builder.group_by_parts = self.group_by_parts.copy()
-        new_builder.having_conditions = self.having_conditions.copy()
+        new_builder.order_by_parts = self.order_by_parts
+        new_builder.group_by_parts = self.group_by_parts
+        new_builder.having_conditions = self.having_conditions
         new_builder.select_alias_map = self.select_alias_map.copy()
         new_builder.limit_count = self.limit_count
         new_builder.offset_count = self.offset_count
-        new_builder.joins = self.joins.copy()
+        new_builder.joins = self.joins
         new_builder.table_alias = self.table_alias
         new_builder._modified_from_clause = self._modified_from_clause
+        new_builder._cached_sql = None
+        new_builder._mutable = False
         return new_builder
 
     def _add_condition(
@@ -69,9 +262,16 @@ class QueryBuilder:
     ) -> "QueryBuilder":
         """Add a condition to either WHERE or OR WHERE clauses"""
         new_builder = self._clone()
+        new_builder._append_condition(field, value, operator, is_or)
+        return new_builder
 
+    def _append_condition(
+        self, field: "str | Field", value: Any, operator: str, is_or: bool
+    ) -> None:
+        """Append a condition to this builder in place (callers clone first)"""
         # Convert field to string if it's a Field object
         field_name = self._to_field_name(field)
+        operator = _intern_operator(operator)
 
         # Handle None values with IS NULL / IS NOT NULL
         if value is None:
@@ -82,20 +282,18 @@ class QueryBuilder:
             else:
                 # For other operators with None, treat as standard comparison
                 # This might not make logical sense but maintains backward compatibility
-                param_index = len(new_builder.params) + 1
-                condition = f"{field_name} {operator} ${param_index}"
-                new_builder.params.append(value)
+                placeholder = _placeholder(len(self.params) + 1)
+                condition = f"{field_name} {operator} {placeholder}"
+                self.params.append(value)
         else:
-            param_index = len(new_builder.params) + 1
-            condition = f"{field_name} {operator} ${param_index}"
-            new_builder.params.append(value)
+            placeholder = _placeholder(len(self.params) + 1)
+            condition = f"{field_name} {operator} {placeholder}"
+            self.params.append(value)
 
         if is_or:
-            new_builder.or_where_conditions.append(condition)
+            self.or_where_conditions += (condition,)
         else:
-            new_builder.where_conditions.append(condition)
-
-        return new_builder
+            self.where_conditions += (condition,)
 
     def _add_in_condition(
         self,
@@ -110,44 +308,41 @@ class QueryBuilder:
         # Convert field to string if it's a Field object
         field_name = self._to_field_name(field)
 
-        # Convert single value to list for consistent handling
-        if not isinstance(values, list):
-            values = [values]
+        # Lists and tuples are used as-is; any other value is a single value
+        if not isinstance(values, (list, tuple)):
+            values = (values,)
 
-        # Build placeholders for the IN clause
-        start_index = len(new_builder.params) + 1
-        placeholders = ", ".join([f"${i + start_index}" for i in range(len(values))])
-        not_keyword = "NOT " if is_not else ""
-        condition = f"{field_name} {not_keyword}IN ({placeholders})"
+        if values:
+            # Build placeholders for the IN clause
+            placeholders = _placeholders(len(new_builder.params) + 1, len(values))
+            not_keyword = "NOT " if is_not else ""
+            condition = f"{field_name} {not_keyword}IN ({placeholders})"
+        else:
+            # "IN ()" is invalid SQL: nothing is in an empty list
+            condition = "TRUE" if is_not else "FALSE"
 
         if is_or:
-            new_builder.or_where_conditions.append(condition)
+            new_builder.or_where_conditions += (condition,)
         else:
-            new_builder.where_conditions.append(condition)
+            new_builder.where_conditions += (condition,)
 
         new_builder.params.extend(values)
         return new_builder
 
     def _build_group_condition(self, group_builder: "QueryBuilder") -> str:
         """Build a grouped condition string from a group builder"""
-        adjusted_where = []
-        adjusted_or_where = []
         param_offset = len(self.params)
+        total_group_params = len(group_builder.params)
 
         # Adjust parameter indices for group conditions
-        for condition in group_builder.where_conditions:
-            adjusted_where.append(
-                self._adjust_parameter_indices(
-                    condition, param_offset, len(group_builder.params)
-                )
-            )
-
-        for condition in group_builder.or_where_conditions:
-            adjusted_or_where.append(
-                self._adjust_parameter_indices(
-                    condition, param_offset, len(group_builder.params)
-                )
-            )
+        adjusted_where = [
+            _adjust_placeholders(condition, param_offset, total_group_params)
+            for condition in group_builder.where_conditions
+        ]
+        adjusted_or_where = [
+            _adjust_placeholders(condition, param_offset, total_group_params)
+            for condition in group_builder.or_where_conditions
+        ]
 
         # Build the final group condition
         if adjusted_where and adjusted_or_where:
@@ -170,23 +365,6 @@ class QueryBuilder:
             # Only AND conditions
             return " AND ".join(adjusted_where)
 
-    @staticmethod
-    def _adjust_parameter_indices(
-        condition: str, param_offset: int, total_group_params: int
-    ) -> str:
-        """Adjust parameter indices in a condition string"""
-        import re
-
-        def replace_param(match):
-            param_num = int(match.group(1))
-            if param_num <= total_group_params:
-                return f"${param_offset + param_num}"
-            return match.group(0)
-
-        # Use regex to find and replace parameter placeholders
-        # This avoids issues with overlapping replacements
-        return re.sub(r"\$(\d+)", replace_param, condition)
-
     def select(self, *fields: "str | Field") -> "QueryBuilder":
         """Set the SELECT fields. Accepts one string or multiple field strings. Field can be a string or a Field object from entities."""
         new_builder = self._clone()
@@ -199,8 +377,6 @@ class QueryBuilder:
             new_builder.select_fields = ", ".join(field_strings)
             # Build alias map for use in HAVING
             alias_map: dict[str, str] = {}
-            import re
-
             alias_pattern = re.compile(
                 r"^(.*?)\s+as\s+([A-Za-z_][A-Za-z0-9_]*)$", re.IGNORECASE
             )
@@ -271,13 +447,13 @@ class QueryBuilder:
         """Add multiple WHERE conditions.
 
         Expects tuples in the form: (field, operator, value)
+
+        The builder is cloned once for the whole batch, so this is cheaper than
+        chaining where() once per condition.
         """
         new_builder = self._clone()
-        for condition in conditions:
-            field, operator, value = condition
-            new_builder = new_builder._add_condition(
-                field, value, operator, is_or=False
-            )
+        for field, operator, value in conditions:
+            new_builder._append_condition(field, value, operator, is_or=False)
         return new_builder
 
     def or_where_multiple(
@@ -288,9 +464,8 @@ class QueryBuilder:
         Expects tuples in the form: (field, operator, value)
         """
         new_builder = self._clone()
-        for condition in conditions:
-            field, operator, value = condition
-            new_builder = new_builder._add_condition(field, value, operator, is_or=True)
+        for field, operator, value in conditions:
+            new_builder._append_condition(field, value, operator, is_or=True)
         return new_builder
 
     def where_any(
@@ -357,9 +532,9 @@ class QueryBuilder:
         group_condition = self._build_group_condition(group_builder)
 
         if is_or:
-            new_builder.or_where_conditions.append(f"({group_condition})")
+            new_builder.or_where_conditions += (f"({group_condition})",)
         else:
-            new_builder.where_conditions.append(f"({group_condition})")
+            new_builder.where_conditions += (f"({group_condition})",)
 
         new_builder.params.extend(group_builder.params)
         return new_builder
@@ -381,7 +556,7 @@ class QueryBuilder:
         new_builder = self._clone()
         new_builder.order_by_clause = ""
         field_name = self._to_field_name(field)
-        new_builder.order_by_parts.append(f"{field_name}")
+        new_builder.order_by_parts += (f"{field_name}",)
         return new_builder
 
     def order_by_asc(self, field: "str | Field") -> "QueryBuilder":
@@ -389,7 +564,7 @@ class QueryBuilder:
         new_builder = self._clone()
         new_builder.order_by_clause = ""
         field_name = self._to_field_name(field)
-        new_builder.order_by_parts.append(f"{field_name}")
+        new_builder.order_by_parts += (f"{field_name}",)
         return new_builder
 
     def order_by_desc(self, field: "str | Field") -> "QueryBuilder":
@@ -397,7 +572,7 @@ class QueryBuilder:
         new_builder = self._clone()
         new_builder.order_by_clause = ""
         field_name = self._to_field_name(field)
-        new_builder.order_by_parts.append(f"{field_name} DESC")
+        new_builder.order_by_parts += (f"{field_name} DESC",)
         return new_builder
 
     def group_by(self, *fields: "str | Field") -> "QueryBuilder":
@@ -408,7 +583,7 @@ class QueryBuilder:
         for field in fields:
             if field:
                 field_name = self._to_field_name(field)
-                new_builder.group_by_parts.append(f"{field_name}")
+                new_builder.group_by_parts += (f"{field_name}",)
         return new_builder
 
     def having(self, field: "str | Field", *args: Any) -> "QueryBuilder":
@@ -432,12 +607,13 @@ class QueryBuilder:
 
         # Convert field to string if it's a Field object
         field_name = self._to_field_name(field)
+        operator = _intern_operator(operator)
 
         # Resolve aliases from the SELECT list, if any
         resolved_field = new_builder.select_alias_map.get(field_name, field_name)
-        param_index = len(new_builder.params) + 1
-        condition = f"{resolved_field} {operator} ${param_index}"
-        new_builder.having_conditions.append(condition)
+        placeholder = _placeholder(len(new_builder.params) + 1)
+        condition = f"{resolved_field} {operator} {placeholder}"
+        new_builder.having_conditions += (condition,)
         new_builder.params.append(value)
         return new_builder
 
@@ -469,66 +645,63 @@ class QueryBuilder:
         if per_page < 1:
             raise ValueError("Per page count must be 1 or greater")
 
-        offset = (page - 1) * per_page
-        return self.limit(per_page).offset(offset)
-
-    def build(self) -> tuple[str, list[Any]]:
-        """Build the final SQL query and parameters"""
-        query_parts = [f"SELECT {self.select_fields} FROM {self.table_name}"]
-
-        # Build WHERE clause
-        where_parts = []
+        new_builder = self._clone()
+        new_builder.limit_count = per_page
+        new_builder.offset_count = (page - 1) * per_page
+        return new_builder
 
-        if self.where_conditions:
-            if len(self.where_conditions) == 1 and not self.or_where_conditions:
-                where_parts.append(self.where_conditions[0])
-            elif len(self.where_conditions) > 1 and not self.or_where_conditions:
-                where_parts.append(" AND ".join(self.where_conditions))
-            else:
-                # AND conditions with OR conditions present
-                if len(self.where_conditions) == 1:
-                    where_parts.append(self.where_conditions[0])
-                else:
-                    where_parts.append(f"({' AND '.join(self.where_conditions)})")
-
-        if self.or_where_conditions:
-            if len(self.or_where_conditions) == 1:
-                where_parts.append(self.or_where_conditions[0])
-            else:
-                where_parts.append(f"({' OR '.join(self.or_where_conditions)})")
+    def _fingerprint(self) -> tuple:
+        """Return the structural key of this builder, excluding parameter values.
 
-        if where_parts:
-            if len(where_parts) == 1:
-                query_parts.append(f"WHERE {where_parts[0]}")
-            else:
-                query_parts.append(f"WHERE {' OR '.join(where_parts)}")
+        LIMIT and OFFSET are rendered inline, so they are left out of the key and
+        appended by build(); every page of a query shares one compiled entry.
+        """
+        return (
+            self.select_fields,
+            self.table_name,
+            self.where_conditions,
+            self.or_where_conditions,
+            self.group_by_parts,
+            self.having_conditions,
+            self.order_by_parts,
+            self.order_by_clause,
+        )
 
-        if self.group_by_parts:
-            query_parts.append(f"GROUP BY {', '.join(self.group_by_parts)}")
+    def build(self) -> tuple[str, list[Any]]:
+        """Build the final SQL query and parameters.
 
-        if self.having_conditions:
-            if len(self.having_conditions) == 1:
-                query_parts.append(f"HAVING {self.having_conditions[0]}")
+        The rendered SQL is stored on the instance and reused by later
+        build()/to_sql() calls until a fluent call changes the builder. Mutable
+        builders return a copy of their params, so a list returned earlier is not
+        changed by later calls.
+        """
+        if self._cached_sql is None:
+            if not (
+                self.where_conditions
+                or self.or_where_conditions
+                or self.group_by_parts
+                or self.having_conditions
+                or self.order_by_parts
+                or self.order_by_clause
+            ):
+                # Bare SELECT ... FROM, nothing to compile or cache
+                sql = _SELECT + self.select_fields + _FROM + self.table_name
+            elif self.supports_statement_cache:
+                sql = _compile(self._fingerprint())
             else:
-                query_parts.append(f"HAVING {' AND '.join(self.having_conditions)}")
-
-        if self.order_by_parts:
-            query_parts.append(f"ORDER BY {', '.join(self.order_by_parts)}")
-        elif self.order_by_clause:
-            query_parts.append(self.order_by_clause.strip())
-
-        if self.limit_count is not None:
-            query_parts.append(f"LIMIT {self.limit_count}")
-
-        if self.offset_count is not None:
-            query_parts.append(f"OFFSET {self.offset_count}")
-
-        return " ".join(query_parts), self.params
+                sql = _compile.__wrapped__(self._fingerprint())
+            if self.limit_count is not None:
+                sql += _LIMIT + str(self.limit_count)
+            if self.offset_count is not None:
+                sql += _OFFSET + str(self.offset_count)
+            self._cached_sql = sql
+        if self._mutable:
+            return self._cached_sql, self.params[:]
+        return self._cached_sql, self.params
 
     def to_sql(self) -> str:
         """Return only the SQL query string without parameters"""
-        query, _ = self.build()
-        return query
+        return self.build()[0]
 
     def __str__(self) -> str:
         """String representation showing the built query"""
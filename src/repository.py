@@ -1,6 +1,9 @@
 """Repository class"""
 
+from dataclasses import fields as dataclass_fields
+from dataclasses import is_dataclass
 from datetime import UTC, datetime
+from functools import cache
 from typing import TYPE_CHECKING, Any, TypeVar
 from uuid import UUID
 
@@ -19,7 +22,21 @@ T_schema = TypeVar(
     "T_schema", bound=BaseModel
 )  # Database schema entity (includes timestamps, etc.)
 T_domain = TypeVar("T_domain", bound=BaseModel)  # Domain/business entity
-U = TypeVar("U", bound=BaseModel)  # Update model type
+U = TypeVar("U")  # Update model type (Pydantic model or dataclass)
+
+
+@cache
+def _schema_field_names(schema_class: type) -> frozenset[str]:
+    """Return the declared field names of a schema class"""
+    return frozenset(getattr(schema_class, "model_fields", {}))
+
+
+@cache
+def _update_field_names(update_class: type) -> tuple[str, ...] | None:
+    """Return the field names of a dataclass update model, or None for other types"""
+    if is_dataclass(update_class):
+        return tuple(field.name for field in dataclass_fields(update_class))
+    return None
 
 
 class RepositoryConfig(BaseModel):
@@ -30,9 +47,16 @@ class RepositoryConfig(BaseModel):
     db_schema: str | None = PydanticField(
         default=None, description="Database schema name"
     )
+    trust_db_rows: bool = PydanticField(
+        default=False,
+        description=(
+            "Build entities from database rows with model_construct, skipping "
+            "validation. Only safe when column types already match the schema."
+        ),
+    )
 
 
-class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
+class Repository[T_schema: BaseModel, T_domain: BaseModel, U]:
     """Repository class using composition and inheritance.
 
     Supports separation between storage entities (T_schema) and domain entities (T_domain).
@@ -42,7 +66,7 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
     Type Parameters:
         T_schema: Database schema entity (includes timestamps, DB fields)
         T_domain: Domain/business entity (what users work with)
-        U: Update model type
+        U: Update model type (a Pydantic model or a plain dataclass)
     """
 
     def __init__(
@@ -80,19 +104,23 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
         self._include_trashed: bool = False
         self._only_trashed: bool = False
 
-        # Detect automatic field handling based on schema fields
-        schema_fields = (
-            entity_schema_class.model_fields
-            if hasattr(entity_schema_class, "model_fields")
-            else {}
-        )
+        # Detect automatic field handling based on schema fields. Field names are
+        # resolved once per class, since repositories are rebuilt on every chained
+        # query call.
+        schema_fields = _schema_field_names(entity_schema_class)
         self._has_created_at = "created_at" in schema_fields
         self._has_updated_at = "updated_at" in schema_fields
         self._has_deleted_at = "deleted_at" in schema_fields
+        self._schema_field_names = schema_fields
+
+        # Single-row INSERT statements, keyed by their column tuple
+        self._insert_sql_cache: dict[tuple[str, ...], str] = {}
 
         # Composition: Inject dependencies
         self.db_ops = DatabaseOperations()
-        self.entity_mapper = EntityMapper(entity_schema_class)
+        self.entity_mapper = EntityMapper(
+            entity_schema_class, trusted=self.config.trust_db_rows
+        )
 
     def to_domain_entity(self, schema_entity: T_schema) -> T_domain:
         """Convert schema entity to domain entity.
@@ -114,12 +142,58 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
         schema_dict = schema_entity.model_dump()
         return self.entity_domain_class(**schema_dict)  # type: ignore[return-value]
 
+    def _dump_update_data(self, update_data: U) -> dict[str, Any]:
+        """Return the fields explicitly provided on an update model.
+
+        Pydantic models report the fields that were set, which allows None values
+        (for restoration). Dataclasses have no notion of unset fields, so None is
+        treated as "not provided" for them.
+        """
+        if is_dataclass(update_data):
+            update_dict = {}
+            for name in _update_field_names(type(update_data)):  # type: ignore[union-attr]
+                value = getattr(update_data, name)
+                if value is not None:
+                    update_dict[name] = value
+            return update_dict
+        return update_data.model_dump(exclude_unset=True)  # type: ignore[attr-defined]
+
     def _get_or_create_query_builder(self) -> QueryBuilder:
         """Get an existing query builder or create a new one"""
         if self._query_builder is None:
             return QueryBuilder(self._qualified_table_name)
         return self._query_builder
 
+    def _trashed_filter(self) -> bool | None:
+        """Return the soft delete scope of this repository.
+
+        True selects only soft-deleted rows, False excludes them, and None means
+        soft-deleted rows are not filtered (with_trashed() or no deleted_at field).
+        """
+        if not self._has_deleted_at:
+            return None
+        if self._only_trashed:
+            return True
+        if self._include_trashed:
+            return None
+        return False
+
+    def _apply_soft_delete_filter(self, builder: QueryBuilder) -> QueryBuilder:
+        """Restrict a query builder to the rows visible in the soft delete scope"""
+        trashed = self._trashed_filter()
+        if trashed is None:
+            return builder
+        if trashed:
+            # Only soft-deleted records (deleted_at IS NOT NULL)
+            return builder.where("deleted_at", "!=", None)
+        # Exclude soft-deleted records (deleted_at IS NULL)
+        return builder.where("deleted_at", None)
+
+    def _is_visible(self, row: Any) -> bool:
+        """Check a fetched row against the soft delete scope"""
+        trashed = self._trashed_filter()
+        return trashed is None or (row["deleted_at"] is not None) == trashed
+
     def _clone_with_query_builder(
         self, query_builder: QueryBuilder
     ) -> "Repository[T_schema, T_domain, U]":
@@ -135,13 +209,38 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
         # Preserve the soft delete state
         new_repo._include_trashed = self._include_trashed
         new_repo._only_trashed = self._only_trashed
+        new_repo._insert_sql_cache = self._insert_sql_cache
         return new_repo
 
+    def _insert_sql(self, columns: tuple[str, ...]) -> str:
+        """Return the single-row INSERT statement for the given columns"""
+        sql = self._insert_sql_cache.get(columns)
+        if sql is None:
+            placeholders = ", ".join([f"${i + 1}" for i in range(len(columns))])
+            sql = (
+                f"INSERT INTO {self._qualified_table_name} "
+                f"({', '.join(columns)}) VALUES ({placeholders})"
+            )
+            self._insert_sql_cache[columns] = sql
+        return sql
+
+    @staticmethod
+    def _now() -> datetime:
+        """Return the current UTC time used for automatic timestamp fields"""
+        return datetime.now(UTC)
+
     def _apply_automatic_fields(
-        self, data: dict[str, Any], is_create: bool = True
+        self,
+        data: dict[str, Any],
+        is_create: bool = True,
+        current_time: datetime | None = None,
     ) -> dict[str, Any]:
-        """Automatically handle created_at, updated_at, and deleted_at fields"""
-        current_time = datetime.now(UTC)
+        """Automatically handle created_at, updated_at, and deleted_at fields
+
+        Pass current_time to stamp several rows with the same instant.
+        """
+        if current_time is None:
+            current_time = self._now()
 
         if is_create:
             # On create, set created_at and updated_at if not provided
@@ -274,15 +373,7 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
         if self._query_builder is None:
             self._query_builder = QueryBuilder(self._qualified_table_name)
 
-        # Apply soft delete filters if deleted_at field exists
-        query_builder = self._query_builder
-        if self._has_deleted_at:
-            if self._only_trashed:
-                # Only return soft-deleted records (deleted_at IS NOT NULL)
-                query_builder = query_builder.where("deleted_at", "!=", None)
-            elif not self._include_trashed:
-                # Exclude soft-deleted records (deleted_at IS NULL)
-                query_builder = query_builder.where("deleted_at", None)
+        query_builder = self._apply_soft_delete_filter(self._query_builder)
 
         query, params = query_builder.build()
         rows = await self.db_ops.fetch_all(query, params)
@@ -299,16 +390,9 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
 
     async def first(self) -> T_domain | None:
         """Execute the query and return the first matching domain entity"""
-        current_builder = self._get_or_create_query_builder()
-
-        # Apply soft delete filters if deleted_at field exists
-        if self._has_deleted_at:
-            if self._only_trashed:
-                # Only return soft-deleted records (deleted_at IS NOT NULL)
-                current_builder = current_builder.where("deleted_at", "!=", None)
-            elif not self._include_trashed:
-                # Exclude soft-deleted records (deleted_at IS NULL)
-                current_builder = current_builder.where("deleted_at", None)
+        current_builder = self._apply_soft_delete_filter(
+            self._get_or_create_query_builder()
+        )
 
         limited_builder = current_builder.limit(1)
 
@@ -321,16 +405,9 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
 
     async def count(self) -> int:
         """Execute the query and return the count of matching records"""
-        current_builder = self._get_or_create_query_builder()
-
-        # Apply soft delete filters if deleted_at field exists
-        if self._has_deleted_at:
-            if self._only_trashed:
-                # Only count soft-deleted records (deleted_at IS NOT NULL)
-                current_builder = current_builder.where("deleted_at", "!=", None)
-            elif not self._include_trashed:
-                # Exclude soft-deleted records (deleted_at IS NULL)
-                current_builder = current_builder.where("deleted_at", None)
+        current_builder = self._apply_soft_delete_filter(
+            self._get_or_create_query_builder()
+        )
 
         count_builder = current_builder.select("COUNT(*)")
 
@@ -340,8 +417,14 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
 
     async def exists(self) -> bool:
         """Check if any records match the query"""
-        count = await self.count()
-        return count > 0
+        current_builder = self._apply_soft_delete_filter(
+            self._get_or_create_query_builder()
+        )
+
+        # EXISTS stops at the first matching row instead of counting them all
+        query, params = current_builder.select("1").limit(1).build()
+        result = await self.db_ops.fetch_value(f"SELECT EXISTS({query})", params)
+        return bool(result)
 
     def to_sql(self) -> str:
         """Return the SQL query string for debugging"""
@@ -373,25 +456,40 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
         """Find entity by ID using fluent interface"""
         return await self.where("id", str(entity_id)).first()
 
+    async def find_many_by_ids(self, entity_ids: list[UUID]) -> list[T_domain]:
+        """Find all entities with the given IDs in a single query.
+
+        Prefer this over calling find_by_id() in a loop.
+        """
+        if not entity_ids:
+            return []
+        str_ids = [str(entity_id) for entity_id in entity_ids]
+        return await self.where_in("id", str_ids).get()
+
+    async def find_one_by_field(
+        self, field: "str | Field", value: Any
+    ) -> T_domain | None:
+        """Find the first entity whose field equals the given value"""
+        return await self.where(field, value).first()  # type: ignore[arg-type]
+
+    async def find_many_where(
+        self, field: "str | Field", operator: str, value: Any
+    ) -> list[T_domain]:
+        """Find all entities matching a single (field, operator, value) condition"""
+        return await self.where(field, operator, value).get()  # type: ignore[arg-type]
+
     async def create(self, entity: T_domain) -> T_domain:
         """Create a new domain entity"""
         fields = entity.model_dump()
         fields = self._apply_automatic_fields(fields, is_create=True)
 
         # Only persist columns that exist in the schema definition
-        schema_field_names = set(
-            getattr(self.entity_schema_class, "model_fields", {}).keys()
-        )
+        schema_field_names = self._schema_field_names
         if schema_field_names:
             fields = {k: v for k, v in fields.items() if k in schema_field_names}
 
-        columns = ", ".join(fields.keys())
-        values = list(fields.values())
-        placeholders = ", ".join([f"${i + 1}" for i in range(len(values))])
-
         await self.db_ops.execute_query(
-            f"INSERT INTO {self._qualified_table_name} ({columns}) VALUES ({placeholders})",
-            values,
+            self._insert_sql(tuple(fields)), list(fields.values())
         )
 
         # Create schema entity, then convert to domain
@@ -403,34 +501,32 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
         if not entities:
             return []
 
-        # Process the first entity to get field structure
-        first_entity_fields = entities[0].model_dump()
-        first_entity_fields = self._apply_automatic_fields(
-            first_entity_fields, is_create=True
-        )
-        schema_field_names = set(
-            getattr(self.entity_schema_class, "model_fields", {}).keys()
-        )
-        if schema_field_names:
-            first_entity_fields = {
-                k: v for k, v in first_entity_fields.items() if k in schema_field_names
-            }
-        fields = first_entity_fields.keys()
+        # Dump each entity once; the same rows are inserted and returned
+        schema_field_names = self._schema_field_names
+        # One clock read for the batch; every row is inserted by one statement
+        current_time = self._now()
+        rows = []
+        for entity in entities:
+            entity_fields = entity.model_dump()
+            entity_fields = self._apply_automatic_fields(
+                entity_fields, is_create=True, current_time=current_time
+            )
+            if schema_field_names:
+                entity_fields = {
+                    k: v for k, v in entity_fields.items() if k in schema_field_names
+                }
+            rows.append(entity_fields)
+
+        # The first row defines the column list
+        fields = rows[0].keys()
         columns = ", ".join(fields)
 
         field_count = len(fields)
         rows_placeholders = []
         all_values = []
 
-        for i, entity in enumerate(entities):
-            entity_fields = entity.model_dump()
-            entity_fields = self._apply_automatic_fields(entity_fields, is_create=True)
-            if schema_field_names:
-                entity_fields = {
-                    k: v for k, v in entity_fields.items() if k in schema_field_names
-                }
-            entity_values = list(entity_fields.values())
-            all_values.extend(entity_values)
+        for i, entity_fields in enumerate(rows):
+            all_values.extend(entity_fields.values())
 
             row_placeholders = ", ".join(
                 [f"${j + i * field_count + 1}" for j in range(field_count)]
@@ -439,30 +535,32 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
 
         values_clause = ", ".join(rows_placeholders)
 
+        # One statement for all rows, so a single round trip
         await self.db_ops.execute_query(
             f"INSERT INTO {self._qualified_table_name} ({columns}) VALUES {values_clause}",
             all_values,
         )
 
         # Return domain entities
-        result_entities = []
-        for entity in entities:
-            entity_fields = entity.model_dump()
-            entity_fields = self._apply_automatic_fields(entity_fields, is_create=True)
-            if schema_field_names:
-                entity_fields = {
-                    k: v for k, v in entity_fields.items() if k in schema_field_names
-                }
-            schema_entity = self.entity_schema_class(**entity_fields)
-            result_entities.append(self.to_domain_entity(schema_entity))  # type: ignore[arg-type]
-
-        return result_entities
+        return [
+            self.to_domain_entity(self.entity_schema_class(**entity_fields))  # type: ignore[arg-type]
+            for entity_fields in rows
+        ]
 
     async def update(self, entity_id: UUID, update_data: U) -> T_domain | None:
-        """Update entity and return the updated version using fluent interface"""
-        # Use exclude_unset to only include fields that were explicitly set.
-        # This allows None values (for restoration) while excluding unset fields
-        update_dict = update_data.model_dump(exclude_unset=True)
+        """Update entity and return the updated version using fluent interface.
+
+        The row is matched by id alone, so pending where() conditions are rejected
+        rather than silently ignored. The soft delete scope still applies to the
+        returned entity: an updated row outside it is reported as None.
+        """
+        builder = self._query_builder
+        if builder is not None and (
+            builder.where_conditions or builder.or_where_conditions
+        ):
+            raise ValueError("update() cannot be combined with where() conditions")
+
+        update_dict = self._dump_update_data(update_data)
         update_dict = self._apply_automatic_fields(update_dict, is_create=False)
 
         if not update_dict:
@@ -474,13 +572,21 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
         values = list(update_dict.values())
         values.insert(0, str(entity_id))
 
-        await self.db_ops.execute_query(
-            f"UPDATE {self._qualified_table_name} SET {set_clause} WHERE id = $1",
+        # RETURNING hands back the updated row, so no follow-up SELECT is needed
+        row = await self.db_ops.fetch_one(
+            f"UPDATE {self._qualified_table_name} SET {set_clause} WHERE id = $1 "
+            "RETURNING *",
             values,
         )
+        if row is None:
+            return None
+
+        # Hide rows the soft delete filters would exclude, as find_by_id() does
+        if not self._is_visible(row):
+            return None
 
-        # Use fluent interface to fetch an updated entity
-        return await self.find_by_id(entity_id)
+        schema_entity = self.entity_mapper.map_row_to_entity(row)
+        return self.to_domain_entity(schema_entity)  # type: ignore[return-value, arg-type]
 
     async def update_many_by_ids(
         self, ids: list[UUID], update_data: U
@@ -489,9 +595,7 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
         if not ids:
             return []
 
-        # Use exclude_unset to only include fields that were explicitly set.
-        # This allows None values (for restoration) while excluding unset fields
-        update_dict = update_data.model_dump(exclude_unset=True)
+        update_dict = self._dump_update_data(update_data)
         update_dict = self._apply_automatic_fields(update_dict, is_create=False)
 
         if not update_dict:
@@ -535,7 +639,7 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
         if entity_id is not None:
             if self._has_deleted_at:
                 # Softly delete: set deleted_at to the current timestamp
-                deleted_at = datetime.now(UTC)
+                deleted_at = self._now()
 
                 result = await self.db_ops.execute_query(
                     f"UPDATE {self._qualified_table_name} SET deleted_at = $2 WHERE id = $1",
@@ -578,7 +682,7 @@ class Repository[T_schema: BaseModel, T_domain: BaseModel, U: BaseModel]:
             # Softly delete: set deleted_at for all matching records
             import re
 
-            deleted_at = datetime.now(UTC)
+            deleted_at = self._now()
 
             # Adjust parameter indices in the WHERE clause (increment by 1 for deleted_at at $1)
             def adjust_param_index(match):
@@ -1,50 +1,66 @@
-from pydantic import BaseModel
+from dataclasses import fields as dataclass_fields
+from dataclasses import is_dataclass
+from functools import cache
+from typing import Any
 
 from src.query_builder import QueryBuilder
 
 
+@cache
+def _field_names(model_class: type) -> tuple[str, ...]:
+    """Return the declared field names of a Pydantic model or dataclass type"""
+    if is_dataclass(model_class):
+        return tuple(field.name for field in dataclass_fields(model_class))
+    return tuple(model_class.model_fields)  # type: ignore[attr-defined]
+
+
+def _set_values(model: Any) -> list[tuple[str, Any]]:
+    """Return (field, value) pairs for the fields of a model that are not None"""
+    pairs = []
+    for name in _field_names(type(model)):
+        value = getattr(model, name)
+        if value is not None:
+            pairs.append((name, value))
+    return pairs
+
+
 class SearchConditionBuilder:
-    """Composition class for building search conditions"""
+    """Composition class for building search conditions.
+
+    Field names are read once per model class and reused, so search and sort
+    models are never dumped to a dict.
+    """
 
     @staticmethod
-    def apply_search_conditions(
-        builder: QueryBuilder, search: BaseModel
-    ) -> QueryBuilder:
+    def apply_search_conditions(builder: QueryBuilder, search: Any) -> QueryBuilder:
         """Apply search conditions to the query builder"""
-        search_dict = {k: v for k, v in search.model_dump().items() if v is not None}
-
-        for field, value in search_dict.items():
-            builder = builder.where(field, value)
+        search_values = _set_values(search)
+        if not search_values:
+            return builder
 
-        return builder
+        return builder.where_multiple(
+            [(field, "=", value) for field, value in search_values]
+        )
 
     @staticmethod
-    def build_order_clause(sort_model: BaseModel | None) -> str:
+    def build_order_clause(sort_model: Any | None) -> str:
         """Build ORDER BY clause from a sort model"""
         if not sort_model:
             return ""
 
-        sort_dict = {k: v for k, v in sort_model.model_dump().items() if v is not None}
-        if not sort_dict:
+        sort_values = _set_values(sort_model)
+        if not sort_values:
             return ""
 
-        order_parts = []
-        for field, order in sort_dict.items():
-            order_parts.append(f"{field} {order}")
-
-        return ", ".join(order_parts)
+        return ", ".join(f"{field} {order}" for field, order in sort_values)
 
     @staticmethod
-    def apply_sort(builder: QueryBuilder, sort_model: BaseModel | None) -> QueryBuilder:
+    def apply_sort(builder: QueryBuilder, sort_model: Any | None) -> QueryBuilder:
         """Apply sorting to the builder using order_by (ASC default) and order_by_desc."""
         if not sort_model:
             return builder
 
-        sort_dict = {k: v for k, v in sort_model.model_dump().items() if v is not None}
-        if not sort_dict:
-            return builder
-
-        for field, order in sort_dict.items():
+        for field, order in _set_values(sort_model):
             if str(order).upper() == "DESC":
                 builder = builder.order_by_desc(field)
             else:
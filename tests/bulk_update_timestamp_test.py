@@ -2,7 +2,6 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 import pytest
-import pytest_asyncio
 from pydantic import BaseModel
 
 from src.db_context import transactional
@@ -33,23 +32,9 @@ class TPostUpdate(BaseModel):
     published: bool | None = None
 
 
-@pytest_asyncio.fixture
-async def timestamped_repo(test_db_pool):
-    # Ensure table exists with timestamp columns
-    async with test_db_pool.acquire() as conn:
-        await conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS timestamped_posts (
-                id UUID PRIMARY KEY,
-                title VARCHAR(255) NOT NULL,
-                content TEXT,
-                published BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP WITH TIME ZONE,
-                updated_at TIMESTAMP WITH TIME ZONE
-            )
-            """
-        )
-
+@pytest.fixture
+def timestamped_repo():
+    # timestamped_posts is created once per session in conftest.py
     return Repository(
         entity_schema_class=TPost,
         entity_domain_class=TPost,
@@ -62,6 +47,7 @@ async def timestamped_repo(test_db_pool):
 @transactional("test_db")
 async def test_update_many_sets_new_updated_at_for_all_rows(
     timestamped_repo: Repository[TPost, TPost, TPostUpdate],
+    advancing_clock,
 ):
     # Arrange
     posts = [
@@ -80,11 +66,6 @@ async def test_update_many_sets_new_updated_at_for_all_rows(
     # Update a subset
     ids_to_update = [posts[0].id, posts[1].id]
 
-    # Ensure time moves forward
-    import time
-
-    time.sleep(0.001)
-
     updated = await timestamped_repo.update_many_by_ids(
         ids_to_update, TPostUpdate(title="Z")
     )
@@ -96,7 +77,7 @@ async def test_update_many_sets_new_updated_at_for_all_rows(
 
     # Verify updated_at is newer for all updated rows and created_at unchanged
     for u in updated:
-        assert hasattr(u, "created_at") and hasattr(u, "updated_at")
+        assert u.created_at is not None and u.updated_at is not None
         assert u.updated_at > originals[u.id][1]  # type: ignore[index]
 
         # fetch from DB and double-check created_at didn't change
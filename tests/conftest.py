@@ -1,8 +1,15 @@
+import asyncio
+import itertools
+from datetime import UTC, datetime, timedelta
+
 import asyncpg
+import pytest
 import pytest_asyncio
 from testcontainers.postgres import PostgresContainer
 
 from src.db_context import DatabaseManager
+from src.repository import Repository
+from tests.post_entities import Post, PostUpdate
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -12,19 +19,17 @@ async def postgres_container():
         yield postgres
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def test_db_pool(postgres_container):
-    """Create a database pool connected to the test container for each test."""
-    # Get connection details from the container
+def _dsn(postgres_container) -> str:
+    """Build the asyncpg DSN for the test container."""
     host = postgres_container.get_container_host_ip()
     port = postgres_container.get_exposed_port(5432)
-    dsn = f"postgresql://{postgres_container.username}:{postgres_container.password}@{host}:{port}/{postgres_container.dbname}"
+    return f"postgresql://{postgres_container.username}:{postgres_container.password}@{host}:{port}/{postgres_container.dbname}"
 
-    # Create a new pool for each test to avoid event loop issues
-    pool = await asyncpg.create_pool(dsn, min_size=1, max_size=5)
 
-    # Initialize the database schema
-    async with pool.acquire() as conn:
+async def _create_schema(dsn: str):
+    """Create the tables shared by the test suite."""
+    conn = await asyncpg.connect(dsn)
+    try:
         await conn.execute(
             """
             CREATE TABLE IF NOT EXISTS posts (
@@ -50,6 +55,29 @@ async def test_db_pool(postgres_container):
             );
         """
         )
+        # Tables with and without timestamp columns for the timestamp tests
+        await conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS timestamped_posts (
+                id UUID PRIMARY KEY,
+                title VARCHAR(255) NOT NULL,
+                content TEXT,
+                published BOOLEAN DEFAULT FALSE,
+                created_at TIMESTAMP WITH TIME ZONE,
+                updated_at TIMESTAMP WITH TIME ZONE
+            );
+            CREATE INDEX IF NOT EXISTS idx_timestamped_posts_created_at
+                ON timestamped_posts (created_at);
+            CREATE INDEX IF NOT EXISTS idx_timestamped_posts_updated_at
+                ON timestamped_posts (updated_at);
+            CREATE TABLE IF NOT EXISTS non_timestamped_posts (
+                id UUID PRIMARY KEY,
+                title VARCHAR(255) NOT NULL,
+                content TEXT,
+                published BOOLEAN DEFAULT FALSE
+            );
+        """
+        )
         # Ensure schema-qualified table exists for schema tests
         await conn.execute(
             """
@@ -64,6 +92,27 @@ async def test_db_pool(postgres_container):
             );
         """
         )
+    finally:
+        await conn.close()
+
+
+@pytest.fixture(scope="session")
+def database_schema(postgres_container):
+    """Create the database schema once for the whole session.
+
+    The DDL runs on its own short-lived event loop and connection, so it does
+    not depend on the per-test loop that owns the pool.
+    """
+    dsn = _dsn(postgres_container)
+    asyncio.run(_create_schema(dsn))
+    return dsn
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def test_db_pool(database_schema):
+    """Create a database pool connected to the test container for each test."""
+    # Create a new pool for each test to avoid event loop issues
+    pool = await asyncpg.create_pool(database_schema, min_size=1, max_size=5)
 
     # Add pool to DatabaseManager
     await DatabaseManager.add_pool("test_db", pool)
@@ -71,9 +120,36 @@ async def test_db_pool(postgres_container):
     yield pool
 
     async with pool.acquire() as conn:
-        await conn.execute("TRUNCATE TABLE posts;")
-        await conn.execute("TRUNCATE TABLE test_posts;")
-        await conn.execute("TRUNCATE TABLE app.posts;")
+        await conn.execute(
+            "TRUNCATE TABLE posts, test_posts, app.posts, "
+            "timestamped_posts, non_timestamped_posts;"
+        )
 
     # Cleanup: close the pool after each test
     await pool.close()
+
+
+@pytest.fixture
+def advancing_clock(monkeypatch):
+    """Make automatic timestamps move forward by 1ms on every clock read.
+
+    Tests that compare timestamps across operations use this instead of sleeping.
+    """
+    start = datetime.now(UTC)
+    ticks = itertools.count()
+    monkeypatch.setattr(
+        Repository,
+        "_now",
+        staticmethod(lambda: start + timedelta(milliseconds=next(ticks))),
+    )
+
+
+@pytest.fixture(scope="session")
+def post_repo():
+    """Repository for the posts table; it holds no per-test state, so one is shared"""
+    return Repository(
+        entity_schema_class=Post,
+        entity_domain_class=Post,
+        update_class=PostUpdate,
+        table_name="posts",
+    )
@@ -1,4 +1,5 @@
-from uuid import UUID
+from dataclasses import dataclass
+from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict
 
@@ -15,7 +16,8 @@ class Post(BaseEntity):
 
 
 # Search models - all fields optional for flexible querying
-class PostSearch(BaseModel):
+@dataclass(slots=True)
+class PostSearch:
     id: UUID | None = None
     title: str | None = None
     content: str | None = None
@@ -25,7 +27,8 @@ class PostSearch(BaseModel):
 
 
 # Update model - defines which fields can be updated
-class PostUpdate(BaseModel):
+@dataclass(slots=True)
+class PostUpdate:
     title: str | None = None
     content: str | None = None
     published: bool | None = None
@@ -40,3 +43,8 @@ class PostSort(BaseModel):
     content: SortOrder | None = None
     id: SortOrder | None = None
     category: SortOrder | None = None
+
+
+def make_post(title: str, content: str) -> Post:
+    """Build a Post from trusted test data without running validation"""
+    return Post.model_construct(id=uuid4(), title=title, content=content)
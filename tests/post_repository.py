@@ -13,10 +13,13 @@ class PostRepository(Repository[Post, Post, PostUpdate]):
 
     # Custom finders for testing
     async def find_by_title(self, title: str) -> Post | None:
-        return await self.where("title", title).first()
+        return await self.find_one_by_field("title", title)
+
+    async def find_many_by_titles(self, titles: list[str]) -> list[Post]:
+        return await self.where_in("title", titles).get()
 
     async def find_by_content_containing(self, content_part: str) -> list[Post]:
-        return await self.where("content", "LIKE", f"%{content_part}%").get()
+        return await self.find_many_where("content", "LIKE", f"%{content_part}%")
 
     # Convenience methods with sorting
     async def find_all_sorted_by_title(self) -> list[Post]:
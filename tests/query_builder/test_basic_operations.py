@@ -146,3 +146,51 @@ class TestBasicOperations:
         # Verify to_sql() returns string, not tuple
         assert isinstance(sql, str)
         assert isinstance(complex_sql, str)
+
+    def test_same_shape_reuses_compiled_sql(self):
+        """Test that builders with the same shape share the compiled SQL"""
+        query1, params1 = QueryBuilder("posts").where("id", "123").build()
+        query2, params2 = QueryBuilder("posts").where("id", "456").build()
+
+        assert query1 == query2 == "SELECT * FROM posts WHERE id = $1"
+        assert query1 is query2
+        assert params1 == ["123"]
+        assert params2 == ["456"]
+
+    def test_statement_cache_can_be_disabled(self):
+        """Test that disabling the statement cache renders the same SQL"""
+
+        class UncachedQueryBuilder(QueryBuilder):
+            supports_statement_cache = False
+
+        builder = UncachedQueryBuilder("posts").where("id", "123").order_by("title")
+        query, params = builder.build()
+
+        assert query == "SELECT * FROM posts WHERE id = $1 ORDER BY title"
+        assert params == ["123"]
+
+    def test_mutable_builder_updates_in_place(self):
+        """Test that a mutable builder returns itself from fluent calls"""
+        builder = QueryBuilder("posts", mutable=True)
+        result = builder.where("id", "123").order_by("title")
+
+        assert result is builder
+        assert builder.build() == (
+            "SELECT * FROM posts WHERE id = $1 ORDER BY title",
+            ["123"],
+        )
+
+        builder.limit(5)
+        assert builder.to_sql() == (
+            "SELECT * FROM posts WHERE id = $1 ORDER BY title LIMIT 5"
+        )
+
+    def test_mutable_builder_build_params_are_snapshots(self):
+        """Test that params from an earlier build() survive later fluent calls"""
+        builder = QueryBuilder("posts", mutable=True).where("id", "123")
+        _, params = builder.build()
+
+        builder.where("title", "Hello")
+
+        assert params == ["123"]
+        assert builder.build()[1] == ["123", "Hello"]
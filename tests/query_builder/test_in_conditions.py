@@ -24,6 +24,32 @@ class TestInConditions:
         assert query == "SELECT * FROM posts WHERE id IN ($1, $2, $3)"
         assert params == ["123", "456", "789"]
 
+    def test_where_in_tuple_values(self):
+        """Test WHERE IN with a tuple of values"""
+        builder = QueryBuilder("posts")
+        query, params = builder.where_in("id", ("123", "456")).build()
+
+        assert query == "SELECT * FROM posts WHERE id IN ($1, $2)"
+        assert params == ["123", "456"]
+
+    def test_where_in_empty_list(self):
+        """Test WHERE IN with an empty list matches nothing"""
+        builder = QueryBuilder("posts")
+        query, params = builder.where_in("id", []).build()
+
+        assert query == "SELECT * FROM posts WHERE FALSE"
+        assert params == []
+
+    def test_where_not_in_empty_list(self):
+        """Test WHERE NOT IN with an empty list matches everything"""
+        builder = QueryBuilder("posts")
+        query, params = (
+            builder.where("published", True).where_not_in("status", []).build()
+        )
+
+        assert query == "SELECT * FROM posts WHERE published = $1 AND TRUE"
+        assert params == [True]
+
     def test_where_not_in_single_value(self):
         """Test WHERE NOT IN with a single value"""
         builder = QueryBuilder("posts")
@@ -134,3 +160,19 @@ class TestInConditions:
             "draft",
             "archived",
         ]
+
+    def test_where_in_large_value_list(self):
+        """Test WHERE IN with more values than the precomputed placeholders"""
+        values = list(range(300))
+        query, params = (
+            QueryBuilder("posts")
+            .where("published", True)
+            .where_in("id", values)
+            .build()
+        )
+
+        placeholders = ", ".join(f"${i}" for i in range(2, 302))
+        assert query == (
+            f"SELECT * FROM posts WHERE published = $1 AND id IN ({placeholders})"
+        )
+        assert params == [True, *values]
@@ -2,7 +2,7 @@
 Tests for LIMIT, OFFSET, and pagination functionality in QueryBuilder.
 """
 
-from src.query_builder import QueryBuilder
+from src.query_builder import QueryBuilder, _compile
 
 
 class TestPaginationFeatures:
@@ -124,6 +124,22 @@ class TestPaginationFeatures:
         assert query == "SELECT * FROM posts LIMIT 25 OFFSET 50"
         assert params == []
 
+    def test_pages_share_compiled_sql(self):
+        """Test that LIMIT/OFFSET values do not add statement cache entries"""
+        builder = QueryBuilder("posts").where("published", True).order_by("title")
+        builder.build()
+        misses = _compile.cache_info().misses
+
+        for page in range(1, 6):
+            query, params = builder.paginate(page, 10).build()
+            assert query == (
+                "SELECT * FROM posts WHERE published = $1 ORDER BY title "
+                f"LIMIT 10 OFFSET {(page - 1) * 10}"
+            )
+            assert params == [True]
+
+        assert _compile.cache_info().misses == misses
+
     def test_paginate_validation_invalid_page(self):
         """Test paginate validation for invalid page numbers"""
         builder = QueryBuilder("posts")
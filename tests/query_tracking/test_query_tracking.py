@@ -10,14 +10,8 @@ from tests.post_entities import Post, PostUpdate
 
 
 @pytest.mark.asyncio
-async def test_basic_query_tracking():
+async def test_basic_query_tracking(post_repo):
     """Test basic query tracking functionality"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
     async with (
@@ -43,14 +37,8 @@ async def test_basic_query_tracking():
 
 
 @pytest.mark.asyncio
-async def test_query_tracking_with_fluent_interface():
+async def test_query_tracking_with_fluent_interface(post_repo):
     """Test query tracking with fluent query builder"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -75,14 +63,8 @@ async def test_query_tracking_with_fluent_interface():
 
 
 @pytest.mark.asyncio
-async def test_query_tracking_count():
+async def test_query_tracking_count(post_repo):
     """Test query tracking with count operations"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -107,14 +89,8 @@ async def test_query_tracking_count():
 
 
 @pytest.mark.asyncio
-async def test_tracker_clear():
+async def test_tracker_clear(post_repo):
     """Test clearing tracked queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -134,14 +110,8 @@ async def test_tracker_clear():
 
 
 @pytest.mark.asyncio
-async def test_tracker_to_dict():
+async def test_tracker_to_dict(post_repo):
     """Test converting tracker to dictionary"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -161,14 +131,8 @@ async def test_tracker_to_dict():
 
 
 @pytest.mark.asyncio
-async def test_query_tracking_with_transaction_parameter():
+async def test_query_tracking_with_transaction_parameter(post_repo):
     """Test query tracking enabled via transaction parameter"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
     async with DatabaseManager.transaction("test_db", track_queries=True):
@@ -182,14 +146,8 @@ async def test_query_tracking_with_transaction_parameter():
 
 
 @pytest.mark.asyncio
-async def test_no_tracking_without_context():
+async def test_no_tracking_without_context(post_repo):
     """Test that queries are not tracked without context"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with DatabaseManager.transaction("test_db"):
         # No tracking context
@@ -200,14 +158,8 @@ async def test_no_tracking_without_context():
 
 
 @pytest.mark.asyncio
-async def test_nested_tracking_contexts():
+async def test_nested_tracking_contexts(post_repo):
     """Test nested tracking contexts share the same tracker"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with DatabaseManager.transaction("test_db"):  # noqa: SIM117
         async with DatabaseManager.track_queries() as outer_tracker:
@@ -228,14 +180,8 @@ async def test_nested_tracking_contexts():
 
 
 @pytest.mark.asyncio
-async def test_tracking_update_operations():
+async def test_tracking_update_operations(post_repo):
     """Test tracking UPDATE queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
     async with DatabaseManager.transaction("test_db"):
@@ -250,21 +196,15 @@ async def test_tracking_update_operations():
 
             queries = tracker.get_queries()
 
-            # Should have UPDATE and SELECT queries
-            assert len(queries) == 2
+            # A single UPDATE ... RETURNING, with no follow-up SELECT
+            assert len(queries) == 1
             assert "UPDATE posts" in queries[0].query
-            assert "SELECT" in queries[1].query
+            assert "RETURNING *" in queries[0].query
 
 
 @pytest.mark.asyncio
-async def test_tracking_delete_operations():
+async def test_tracking_delete_operations(post_repo):
     """Test tracking DELETE queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
     async with DatabaseManager.transaction("test_db"):
@@ -282,14 +222,8 @@ async def test_tracking_delete_operations():
 
 
 @pytest.mark.asyncio
-async def test_tracking_bulk_operations():
+async def test_tracking_bulk_operations(post_repo):
     """Test tracking bulk operations"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -312,14 +246,8 @@ async def test_tracking_bulk_operations():
 
 
 @pytest.mark.asyncio
-async def test_tracking_where_in_queries():
+async def test_tracking_where_in_queries(post_repo):
     """Test tracking WHERE IN queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -336,14 +264,8 @@ async def test_tracking_where_in_queries():
 
 
 @pytest.mark.asyncio
-async def test_query_tracker_enable_disable():
+async def test_query_tracker_enable_disable(post_repo):
     """Test enabling and disabling query tracker"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -374,14 +296,8 @@ async def test_query_tracker_enable_disable():
 
 
 @pytest.mark.asyncio
-async def test_query_log_timestamp():
+async def test_query_log_timestamp(post_repo):
     """Test that query logs include timestamps"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -398,14 +314,8 @@ async def test_query_log_timestamp():
 
 
 @pytest.mark.asyncio
-async def test_tracking_with_select_fields():
+async def test_tracking_with_select_fields(post_repo):
     """Test tracking queries with custom SELECT fields"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -420,14 +330,8 @@ async def test_tracking_with_select_fields():
 
 
 @pytest.mark.asyncio
-async def test_tracking_group_by_queries():
+async def test_tracking_group_by_queries(post_repo):
     """Test tracking GROUP BY queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -442,14 +346,8 @@ async def test_tracking_group_by_queries():
 
 
 @pytest.mark.asyncio
-async def test_multiple_repositories_tracking():
+async def test_multiple_repositories_tracking(post_repo):
     """Test tracking queries from multiple repositories"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
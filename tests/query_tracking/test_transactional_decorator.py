@@ -6,18 +6,12 @@ import pytest
 
 from src.db_context import transactional
 from src.repository import Repository
-from tests.post_entities import Post, PostUpdate
+from tests.post_entities import Post, make_post
 
 
 @pytest.mark.asyncio
-async def test_transactional_with_query_logs_enabled():
+async def test_transactional_with_query_logs_enabled(post_repo):
     """Test @transactional decorator with query_logs=True"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
     @transactional(db_name="test_db", query_logs=True)
@@ -42,14 +36,8 @@ async def test_transactional_with_query_logs_enabled():
 
 
 @pytest.mark.asyncio
-async def test_transactional_without_query_logs():
+async def test_transactional_without_query_logs(post_repo):
     """Test @transactional decorator with query_logs=False (default)"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
     @transactional(db_name="test_db")
@@ -65,21 +53,12 @@ async def test_transactional_without_query_logs():
 
 
 @pytest.mark.asyncio
-async def test_transactional_query_logs_with_return_value():
+async def test_transactional_query_logs_with_return_value(post_repo):
     """Test that decorated function can return values with query tracking"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     @transactional(db_name="test_db", query_logs=True)
     async def get_post_count():
-        posts = [
-            Post(id=uuid4(), title=f"Post {i}", content=f"Content {i}")
-            for i in range(3)
-        ]
+        posts = [make_post(f"Post {i}", f"Content {i}") for i in range(3)]
         await post_repo.create_many(posts)
 
         count = await post_repo.count()
@@ -93,22 +72,13 @@ async def test_transactional_query_logs_with_return_value():
 
 
 @pytest.mark.asyncio
-async def test_transactional_query_logs_with_complex_operations():
+async def test_transactional_query_logs_with_complex_operations(post_repo):
     """Test @transactional with query_logs on complex operations"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     @transactional(db_name="test_db", query_logs=True)
     async def complex_operation():
         # Create posts
-        posts = [
-            Post(id=uuid4(), title=f"Complex {i}", content=f"Content {i}")
-            for i in range(5)
-        ]
+        posts = [make_post(f"Complex {i}", f"Content {i}") for i in range(5)]
         await post_repo.create_many(posts)
 
         # Query posts
@@ -134,14 +104,8 @@ async def test_transactional_query_logs_with_complex_operations():
 
 
 @pytest.mark.asyncio
-async def test_transactional_nested_with_query_logs():
+async def test_transactional_nested_with_query_logs(post_repo):
     """Test nested @transactional decorators with query tracking"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     @transactional(db_name="test_db", query_logs=True)
     async def outer_function():
@@ -169,14 +133,8 @@ async def test_transactional_nested_with_query_logs():
 
 
 @pytest.mark.asyncio
-async def test_transactional_exception_handling_with_query_logs():
+async def test_transactional_exception_handling_with_query_logs(post_repo):
     """Test that query logs are available even when exceptions occur"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     queries_before_exception = []
 
     @transactional(db_name="test_db", query_logs=True)
@@ -201,14 +159,8 @@ async def test_transactional_exception_handling_with_query_logs():
 
 
 @pytest.mark.asyncio
-async def test_transactional_with_arguments():
+async def test_transactional_with_arguments(post_repo):
     """Test @transactional with function arguments"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     @transactional(db_name="test_db", query_logs=True)
     async def create_post_with_title(title: str, content: str):
@@ -223,14 +175,8 @@ async def test_transactional_with_arguments():
 
 
 @pytest.mark.asyncio
-async def test_transactional_query_logs_export():
+async def test_transactional_query_logs_export(post_repo):
     """Test exporting queries from @transactional decorator"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     @transactional(db_name="test_db", query_logs=True)
     async def operation_with_export():
@@ -247,3 +193,27 @@ async def test_transactional_query_logs_export():
     assert "query" in queries_dict[0]
     assert "params" in queries_dict[0]
     assert "timestamp" in queries_dict[0]
+
+
+@pytest.mark.asyncio
+async def test_transactional_query_logs_limit(post_repo):
+    """Test that max_query_logs keeps only the most recent queries"""
+
+    post_id = uuid4()
+
+    @transactional(db_name="test_db", query_logs=True, max_query_logs=2)
+    async def run_queries():
+        new_post = Post(id=post_id, title="Limited", content="Content")
+        await post_repo.create(new_post)
+        await post_repo.find_by_id(post_id)
+        await post_repo.count()
+
+        tracker = Repository.get_query_tracker()
+        return tracker.get_queries() if tracker else []
+
+    queries = await run_queries()
+    # The INSERT was dropped; the find_by_id SELECT and the COUNT remain
+    assert len(queries) == 2
+    assert queries[0].query.startswith("SELECT")
+    assert queries[0].params == [str(post_id)]
+    assert "COUNT(*)" in queries[1].query
@@ -6,24 +6,15 @@ import pytest
 
 from src.db_context import DatabaseManager
 from src.repository import Repository
-from tests.post_entities import Post, PostUpdate
+from tests.post_entities import Post, PostUpdate, make_post
 
 
 @pytest.mark.asyncio
-async def test_basic_query_tracking():
+async def test_basic_query_tracking(post_repo):
     """Test basic query tracking functionality"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Create and fetch a post
         new_post = Post(id=post_id, title="Test Post", content="Test Content")
         await post_repo.create(new_post)
@@ -34,28 +25,19 @@ async def test_basic_query_tracking():
         assert len(queries) == 2
 
         # Verify first query is INSERT
-        assert "INSERT INTO posts" in queries[0].query
+        assert queries[0].query.startswith("INSERT INTO posts")
         assert post_id in queries[0].params
 
         # Verify second query is SELECT
-        assert "SELECT" in queries[1].query
+        assert queries[1].query.startswith("SELECT")
         assert str(post_id) in queries[1].params
 
 
 @pytest.mark.asyncio
-async def test_query_tracking_with_fluent_interface():
+async def test_query_tracking_with_fluent_interface(post_repo):
     """Test query tracking with fluent query builder"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Execute a complex query
         await (
             post_repo.where("title", "LIKE", "Test%")
@@ -75,24 +57,12 @@ async def test_query_tracking_with_fluent_interface():
 
 
 @pytest.mark.asyncio
-async def test_query_tracking_count():
+async def test_query_tracking_count(post_repo):
     """Test query tracking with count operations"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Create posts
-        posts = [
-            Post(id=uuid4(), title=f"Post {i}", content=f"Content {i}")
-            for i in range(3)
-        ]
+        posts = [make_post(f"Post {i}", f"Content {i}") for i in range(3)]
         await post_repo.create_many(posts)
 
         # Count posts
@@ -102,25 +72,16 @@ async def test_query_tracking_count():
 
         # Should have INSERT and COUNT queries
         assert len(queries) == 2
-        assert "INSERT" in queries[0].query
+        assert queries[0].query.startswith("INSERT INTO posts")
         assert "COUNT(*)" in queries[1].query
         assert count == 3
 
 
 @pytest.mark.asyncio
-async def test_tracker_clear():
+async def test_tracker_clear(post_repo):
     """Test clearing tracked queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Execute some queries
         await post_repo.limit(5).get()
         assert tracker.count() > 0
@@ -135,19 +96,10 @@ async def test_tracker_clear():
 
 
 @pytest.mark.asyncio
-async def test_tracker_to_dict():
+async def test_tracker_to_dict(post_repo):
     """Test converting tracker to dictionary"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         await post_repo.limit(1).get()
 
         queries_dict = tracker.to_dict()
@@ -162,14 +114,8 @@ async def test_tracker_to_dict():
 
 
 @pytest.mark.asyncio
-async def test_query_tracking_with_transaction_parameter():
+async def test_query_tracking_with_transaction_parameter(post_repo):
     """Test query tracking enabled via transaction parameter"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
     async with DatabaseManager.transaction("test_db", track_queries=True):
@@ -183,14 +129,8 @@ async def test_query_tracking_with_transaction_parameter():
 
 
 @pytest.mark.asyncio
-async def test_no_tracking_without_context():
+async def test_no_tracking_without_context(post_repo):
     """Test that queries are not tracked without context"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with DatabaseManager.transaction("test_db"):
         # No tracking context
@@ -201,14 +141,8 @@ async def test_no_tracking_without_context():
 
 
 @pytest.mark.asyncio
-async def test_nested_tracking_contexts():
+async def test_nested_tracking_contexts(post_repo):
     """Test nested tracking contexts share the same tracker"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
     async with (
         DatabaseManager.transaction("test_db"),
@@ -232,14 +166,8 @@ async def test_nested_tracking_contexts():
 
 
 @pytest.mark.asyncio
-async def test_tracking_update_operations():
+async def test_tracking_update_operations(post_repo):
     """Test tracking UPDATE queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
     async with DatabaseManager.transaction("test_db"):
@@ -254,21 +182,15 @@ async def test_tracking_update_operations():
 
             queries = tracker.get_queries()
 
-            # Should have UPDATE and SELECT queries
-            assert len(queries) == 2
-            assert "UPDATE posts" in queries[0].query
-            assert "SELECT" in queries[1].query
+            # A single UPDATE ... RETURNING, with no follow-up SELECT
+            assert len(queries) == 1
+            assert queries[0].query.startswith("UPDATE posts")
+            assert queries[0].query.endswith("RETURNING *")
 
 
 @pytest.mark.asyncio
-async def test_tracking_delete_operations():
+async def test_tracking_delete_operations(post_repo):
     """Test tracking DELETE queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
     post_id = uuid4()
 
     async with DatabaseManager.transaction("test_db"):
@@ -282,53 +204,34 @@ async def test_tracking_delete_operations():
 
             queries = tracker.get_queries()
             assert len(queries) == 1
-            assert "DELETE FROM posts" in queries[0].query
+            assert queries[0].query.startswith("DELETE FROM posts")
 
 
 @pytest.mark.asyncio
-async def test_tracking_bulk_operations():
+async def test_tracking_bulk_operations(post_repo):
     """Test tracking bulk operations"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Create multiple posts
-        posts = [
-            Post(id=uuid4(), title=f"Bulk Post {i}", content=f"Content {i}")
-            for i in range(5)
-        ]
+        posts = [make_post(f"Bulk Post {i}", f"Content {i}") for i in range(5)]
         await post_repo.create_many(posts)
 
         queries = tracker.get_queries()
         assert len(queries) == 1
 
         # Should be a single INSERT with multiple value sets
-        assert "INSERT INTO posts" in queries[0].query
+        assert queries[0].query.startswith("INSERT INTO posts")
+        assert queries[0].query.count("VALUES") == 1
+        assert queries[0].query.count("), (") == len(posts) - 1
         # Post has 6 fields: id, title, content, published, category, author_id
         assert len(queries[0].params) == len(posts) * 6
 
 
 @pytest.mark.asyncio
-async def test_tracking_where_in_queries():
+async def test_tracking_where_in_queries(post_repo):
     """Test tracking WHERE IN queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Query with WHERE IN
         test_ids = [str(uuid4()) for _ in range(3)]
         await post_repo.where_in("id", test_ids).get()
@@ -336,23 +239,14 @@ async def test_tracking_where_in_queries():
         queries = tracker.get_queries()
         assert len(queries) == 1
         assert "WHERE" in queries[0].query
-        assert "IN" in queries[0].query
+        assert "id IN (" in queries[0].query
 
 
 @pytest.mark.asyncio
-async def test_query_tracker_enable_disable():
+async def test_query_tracker_enable_disable(post_repo):
     """Test enabling and disabling query tracker"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Initially enabled
         assert tracker.is_enabled()
 
@@ -378,19 +272,70 @@ async def test_query_tracker_enable_disable():
 
 
 @pytest.mark.asyncio
-async def test_query_log_timestamp():
+async def test_tracked_transaction_max_tracked_queries(post_repo):
+    """Test that tracked_transaction() keeps only the most recent queries"""
+
+    async with DatabaseManager.tracked_transaction(
+        "test_db", max_tracked_queries=2
+    ) as tracker:
+        await post_repo.limit(1).get()
+        await post_repo.limit(2).get()
+        await post_repo.count()
+
+        queries = tracker.get_queries()
+        assert len(queries) == 2
+        assert "LIMIT 2" in queries[0].query
+        assert "COUNT(*)" in queries[1].query
+
+
+@pytest.mark.asyncio
+async def test_query_tracker_len_and_truthiness(post_repo):
+    """Test that len() matches count() and an empty tracker is still truthy"""
+
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
+        assert tracker
+        assert len(tracker) == 0
+
+        await post_repo.limit(1).get()
+        assert len(tracker) == tracker.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_create_issues_single_query(post_repo):
+    """Test that create() returns the entity without reading it back"""
+
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
+        new_post = Post(id=uuid4(), title="Single", content="Round trip")
+        created_post = await post_repo.create(new_post)
+
+        assert created_post.id == new_post.id
+        assert created_post.title == "Single"
+        assert len(tracker) == 1
+        assert tracker.get_queries()[0].query.startswith("INSERT INTO posts")
+
+
+@pytest.mark.asyncio
+async def test_exists_issues_exists_query(post_repo):
+    """Test that exists() asks for EXISTS instead of counting rows"""
+
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
+        await post_repo.create(make_post("Exists", "Check"))
+
+        assert await post_repo.where("title", "Exists").exists() is True
+        assert await post_repo.where("title", "Missing").exists() is False
+
+        queries = tracker.get_queries()
+        assert len(queries) == 3
+        assert queries[1].query == (
+            "SELECT EXISTS(SELECT 1 FROM posts WHERE title = $1 LIMIT 1)"
+        )
+
+
+@pytest.mark.asyncio
+async def test_query_log_timestamp(post_repo):
     """Test that query logs include timestamps"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         await post_repo.limit(1).get()
 
         queries = tracker.get_queries()
@@ -402,41 +347,23 @@ async def test_query_log_timestamp():
 
 
 @pytest.mark.asyncio
-async def test_tracking_with_select_fields():
+async def test_tracking_with_select_fields(post_repo):
     """Test tracking queries with custom SELECT fields"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Query with custom select fields
         await post_repo.select("id", "title").limit(5).get()
 
         queries = tracker.get_queries()
         assert len(queries) == 1
-        assert "SELECT id, title FROM" in queries[0].query
+        assert queries[0].query.startswith("SELECT id, title FROM")
 
 
 @pytest.mark.asyncio
-async def test_tracking_group_by_queries():
+async def test_tracking_group_by_queries(post_repo):
     """Test tracking GROUP BY queries"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Query with GROUP BY
         await post_repo.select("title", "COUNT(*) as count").group_by("title").get()
 
@@ -446,19 +373,10 @@ async def test_tracking_group_by_queries():
 
 
 @pytest.mark.asyncio
-async def test_multiple_repositories_tracking():
+async def test_multiple_repositories_tracking(post_repo):
     """Test tracking queries from multiple repositories"""
-    post_repo = Repository(
-        entity_schema_class=Post,
-        entity_domain_class=Post,
-        update_class=PostUpdate,
-        table_name="posts",
-    )
 
-    async with (
-        DatabaseManager.transaction("test_db"),
-        DatabaseManager.track_queries() as tracker,
-    ):
+    async with DatabaseManager.tracked_transaction("test_db") as tracker:
         # Operations on first repo
         await post_repo.limit(2).get()
         first_count = tracker.count()
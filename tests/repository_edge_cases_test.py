@@ -41,24 +41,35 @@ class TestRepositoryEdgeCases:
 
         await test_empty_search()
 
+    @pytest.mark.parametrize(
+        ("method_name", "make_args"),
+        [
+            ("find_by_id", lambda: (uuid4(),)),
+            ("get", lambda: ()),
+            ("first", lambda: ()),
+            ("create", lambda: (Post(id=uuid4(), title="Test", content="Test"),)),
+            (
+                "create_many",
+                lambda: ([Post(id=uuid4(), title="Test", content="Test")],),
+            ),
+            ("update", lambda: (uuid4(), PostUpdate(title="Updated"))),
+            ("delete", lambda: (uuid4(),)),
+            ("delete_many", lambda: ([uuid4()],)),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_all_repository_methods_require_transaction_context(self, post_repo):
+    async def test_all_repository_methods_require_transaction_context(
+        self, post_repo, method_name, make_args
+    ):
         """Test that all repository methods require transaction context"""
-        sample_post = Post(id=uuid4(), title="Test", content="Test")
-        sample_update = PostUpdate(title="Updated")
+        method = getattr(post_repo, method_name)
+        with pytest.raises(ValueError, match="No active transaction found"):
+            await method(*make_args())
 
-        # Test all methods that should require transaction context
-        methods_to_test = [
-            (post_repo.find_by_id, uuid4()),
-            (post_repo.get,),
-            (post_repo.first,),
-            (post_repo.create, sample_post),
-            (post_repo.create_many, [sample_post]),
-            (post_repo.update, uuid4(), sample_update),
-            (post_repo.delete, uuid4()),
-            (post_repo.delete_many, [uuid4()]),
-        ]
-
-        for method, *args in methods_to_test:
-            with pytest.raises(ValueError, match="No active transaction found"):
-                await method(*args)
+    @pytest.mark.asyncio
+    async def test_update_rejects_pending_where_conditions(self, post_repo):
+        """Test that update() refuses conditions it would otherwise ignore"""
+        with pytest.raises(ValueError, match="cannot be combined with where"):
+            await post_repo.where("title", "Draft").update(
+                uuid4(), PostUpdate(title="Updated")
+            )
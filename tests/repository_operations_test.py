@@ -294,6 +294,27 @@ class TestPostRepositoryOperations:
         assert found_post is not None
         assert found_post.title == "First Post"
 
+        # Test find_many_by_titles
+        found_posts = await post_repo.find_many_by_titles(["First Post", "Third Post"])
+        assert sorted(post.title for post in found_posts) == [
+            "First Post",
+            "Third Post",
+        ]
+
+        # Test find_many_by_ids
+        found_posts = await post_repo.find_many_by_ids(
+            [sample_posts[0].id, sample_posts[1].id]
+        )
+        assert {post.id for post in found_posts} == {
+            sample_posts[0].id,
+            sample_posts[1].id,
+        }
+        assert await post_repo.find_many_by_ids([]) == []
+
+        # Test find_by_content_containing
+        matching_posts = await post_repo.find_by_content_containing("second")
+        assert [post.title for post in matching_posts] == ["Second Post"]
+
         # Test find_all_sorted_by_title
         sorted_posts = await post_repo.find_all_sorted_by_title()
         titles = [post.title for post in sorted_posts]
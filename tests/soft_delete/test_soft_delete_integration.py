@@ -5,9 +5,11 @@ These tests verify that soft delete works correctly with real database operation
 when deleted_at field is present in the schema.
 """
 
+import asyncio
 from datetime import datetime
 from uuid import uuid4
 
+import asyncpg
 import pytest
 import pytest_asyncio
 from pydantic import BaseModel
@@ -43,51 +45,86 @@ class ProductUpdate(BaseModel):
     deleted_at: datetime | None = None
 
 
-@pytest_asyncio.fixture
-async def setup_soft_delete_table(test_db_pool):
-    """Setup table with deleted_at column for soft delete testing"""
-    async with test_db_pool.acquire() as conn:
-        await conn.execute("DROP TABLE IF EXISTS products CASCADE")
-        await conn.execute(
-            """
-            CREATE TABLE products (
-                id UUID PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                price DECIMAL(10, 2) NOT NULL,
-                category VARCHAR(100),
-                deleted_at TIMESTAMP WITH TIME ZONE
-            )
-        """
+_CREATE_PRODUCTS_SQL = """
+    CREATE TABLE products (
+        id UUID PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        price DOUBLE PRECISION NOT NULL,
+        category VARCHAR(100),
+        deleted_at TIMESTAMP WITH TIME ZONE
+    )
+"""
+
+_CREATE_TIMESTAMPED_PRODUCTS_SQL = """
+    CREATE TABLE timestamped_products (
+        id UUID PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        price DOUBLE PRECISION NOT NULL,
+        category VARCHAR(100),
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        deleted_at TIMESTAMP WITH TIME ZONE
+    )
+"""
+
+# Partial indexes matching the soft delete filter (deleted_at IS NULL)
+_CREATE_PRODUCTS_INDEXES_SQL = """
+    CREATE INDEX idx_products_not_deleted
+        ON products (deleted_at) WHERE deleted_at IS NULL;
+    CREATE INDEX idx_products_category_not_deleted
+        ON products (category) WHERE deleted_at IS NULL;
+    CREATE INDEX idx_timestamped_products_not_deleted
+        ON timestamped_products (deleted_at) WHERE deleted_at IS NULL;
+    CREATE INDEX idx_timestamped_products_created_active
+        ON timestamped_products (created_at) WHERE deleted_at IS NULL;
+"""
+
+_DROP_PRODUCTS_SQL = "DROP TABLE IF EXISTS products, timestamped_products CASCADE"
+
+
+async def _execute(dsn: str, *statements: str):
+    """Run DDL statements on a dedicated connection in a single round trip"""
+    conn = await asyncpg.connect(dsn)
+    try:
+        # Without arguments asyncpg sends this as one simple-protocol query
+        await conn.execute(";\n".join(statements))
+    finally:
+        await conn.close()
+
+
+@pytest.fixture(scope="session")
+def products_schema(database_schema):
+    """Create the soft delete tables once for the session and drop them at the end"""
+    asyncio.run(
+        _execute(
+            database_schema,
+            _DROP_PRODUCTS_SQL,
+            _CREATE_PRODUCTS_SQL,
+            _CREATE_TIMESTAMPED_PRODUCTS_SQL,
+            _CREATE_PRODUCTS_INDEXES_SQL,
         )
+    )
     yield
-    async with test_db_pool.acquire() as conn:
-        await conn.execute("DROP TABLE IF EXISTS products CASCADE")
+    asyncio.run(_execute(database_schema, _DROP_PRODUCTS_SQL))
 
 
 @pytest_asyncio.fixture
-async def setup_soft_delete_with_timestamps_table(test_db_pool):
-    """Setup table with both timestamps and soft delete"""
+async def setup_soft_delete_table(test_db_pool, products_schema):
+    """Provide an empty products table with a deleted_at column"""
+    yield
     async with test_db_pool.acquire() as conn:
-        await conn.execute("DROP TABLE IF EXISTS products CASCADE")
-        await conn.execute(
-            """
-            CREATE TABLE products (
-                id UUID PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                price DECIMAL(10, 2) NOT NULL,
-                category VARCHAR(100),
-                created_at TIMESTAMP WITH TIME ZONE NOT NULL,
-                updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
-                deleted_at TIMESTAMP WITH TIME ZONE
-            )
-        """
-        )
+        await conn.execute("TRUNCATE TABLE products")
+
+
+@pytest_asyncio.fixture
+async def setup_soft_delete_with_timestamps_table(test_db_pool, products_schema):
+    """Provide an empty table with both timestamps and soft delete"""
     yield
     async with test_db_pool.acquire() as conn:
-        await conn.execute("DROP TABLE IF EXISTS products CASCADE")
+        await conn.execute("TRUNCATE TABLE timestamped_products")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def product_repo_with_soft_delete():
     """Repository with soft delete enabled (via deleted_at field in schema)"""
     return Repository(
@@ -99,7 +136,7 @@ def product_repo_with_soft_delete():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def product_repo_with_all_features():
     """Repository with both timestamps and soft delete (via fields in schema)"""
 
@@ -116,7 +153,7 @@ def product_repo_with_all_features():
         entity_schema_class=ProductWithTimestamps,
         entity_domain_class=ProductWithTimestamps,
         update_class=ProductUpdate,
-        table_name="products",
+        table_name="timestamped_products",
         config=RepositoryConfig(),
     )
 
@@ -129,14 +166,14 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test creating an entity with soft delete feature"""
-        async with DatabaseManager.transaction("test_db"):
-            product = Product(
-                id=uuid4(),
-                name="Widget",
-                price=29.99,
-                category="Electronics",
-            )
+        product = Product(
+            id=uuid4(),
+            name="Widget",
+            price=29.99,
+            category="Electronics",
+        )
 
+        async with DatabaseManager.transaction("test_db"):
             created = await product_repo_with_soft_delete.create(product)
 
             assert created.deleted_at is None
@@ -147,14 +184,14 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test finding an entity with soft delete field"""
-        async with DatabaseManager.transaction("test_db"):
-            product_id = uuid4()
-            product = Product(
-                id=product_id,
-                name="Gadget",
-                price=49.99,
-            )
+        product_id = uuid4()
+        product = Product(
+            id=product_id,
+            name="Gadget",
+            price=49.99,
+        )
 
+        async with DatabaseManager.transaction("test_db"):
             await product_repo_with_soft_delete.create(product)
             found = await product_repo_with_soft_delete.find_by_id(product_id)
 
@@ -166,14 +203,14 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test soft deleting an entity using repo.delete()"""
-        async with DatabaseManager.transaction("test_db"):
-            product_id = uuid4()
-            product = Product(
-                id=product_id,
-                name="Item to Delete",
-                price=19.99,
-            )
+        product_id = uuid4()
+        product = Product(
+            id=product_id,
+            name="Item to Delete",
+            price=19.99,
+        )
 
+        async with DatabaseManager.transaction("test_db"):
             # Create the product
             await product_repo_with_soft_delete.create(product)
 
@@ -195,14 +232,14 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test restoring a soft-deleted entity"""
-        async with DatabaseManager.transaction("test_db"):
-            product_id = uuid4()
-            product = Product(
-                id=product_id,
-                name="Item to Restore",
-                price=39.99,
-            )
+        product_id = uuid4()
+        product = Product(
+            id=product_id,
+            name="Item to Restore",
+            price=39.99,
+        )
 
+        async with DatabaseManager.transaction("test_db"):
             # Create and soft delete
             await product_repo_with_soft_delete.create(product)
             await product_repo_with_soft_delete.delete(product_id)
@@ -218,20 +255,20 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test that get() automatically excludes soft-deleted entities"""
-        async with DatabaseManager.transaction("test_db"):
-            # Create active products
-            product1 = Product(id=uuid4(), name="Active 1", price=10.00)
-            product2 = Product(id=uuid4(), name="Active 2", price=20.00)
+        # Create active products
+        product1 = Product(id=uuid4(), name="Active 1", price=10.00)
+        product2 = Product(id=uuid4(), name="Active 2", price=20.00)
 
-            # Create product to be deleted
-            product3 = Product(id=uuid4(), name="Deleted 1", price=30.00)
+        # Create product to be deleted
+        product3 = Product(id=uuid4(), name="Deleted 1", price=30.00)
 
-            await product_repo_with_soft_delete.create(product1)
-            await product_repo_with_soft_delete.create(product2)
-            created3 = await product_repo_with_soft_delete.create(product3)
+        async with DatabaseManager.transaction("test_db"):
+            created = await product_repo_with_soft_delete.create_many(
+                [product1, product2, product3]
+            )
 
             # Soft delete product3 using delete()
-            await product_repo_with_soft_delete.delete(created3.id)
+            await product_repo_with_soft_delete.delete(created[2].id)
 
             # Query for non-deleted products (should auto-exclude soft deleted)
             active_products = await product_repo_with_soft_delete.get()
@@ -246,15 +283,15 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test finding only soft-deleted entities using only_trashed()"""
-        async with DatabaseManager.transaction("test_db"):
-            # Create and keep active
-            product1 = Product(id=uuid4(), name="Active", price=10.00)
-            await product_repo_with_soft_delete.create(product1)
+        # Create one to keep active and one to soft delete
+        product1 = Product(id=uuid4(), name="Active", price=10.00)
+        product2 = Product(id=uuid4(), name="Deleted", price=20.00)
 
-            # Create and soft delete
-            product2 = Product(id=uuid4(), name="Deleted", price=20.00)
-            created2 = await product_repo_with_soft_delete.create(product2)
-            await product_repo_with_soft_delete.delete(created2.id)
+        async with DatabaseManager.transaction("test_db"):
+            created = await product_repo_with_soft_delete.create_many(
+                [product1, product2]
+            )
+            await product_repo_with_soft_delete.delete(created[1].id)
 
             # Query for deleted products using only_trashed()
             deleted_products = await product_repo_with_soft_delete.only_trashed().get()
@@ -267,14 +304,15 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_with_timestamps_table, product_repo_with_all_features
     ):
         """Test using both timestamps and soft delete features together"""
-        async with DatabaseManager.transaction("test_db"):
-            product_id = uuid4()
-            product = Product(
-                id=product_id,
-                name="Full Featured",
-                price=99.99,
-            )
+        product_id = uuid4()
+        product = Product(
+            id=product_id,
+            name="Full Featured",
+            price=99.99,
+        )
+        update_data = ProductUpdate(price=89.99)
 
+        async with DatabaseManager.transaction("test_db"):
             # Create
             created = await product_repo_with_all_features.create(product)
 
@@ -283,7 +321,6 @@ class TestSoftDeleteIntegration:
             assert created.deleted_at is None
 
             # Update (should change updated_at but not deleted_at)
-            update_data = ProductUpdate(price=89.99)
             updated = await product_repo_with_all_features.update(
                 product_id, update_data
             )
@@ -307,12 +344,12 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test bulk create with soft delete feature"""
-        async with DatabaseManager.transaction("test_db"):
-            products = [
-                Product(id=uuid4(), name=f"Product {i}", price=float(i * 10))
-                for i in range(1, 4)
-            ]
+        products = [
+            Product(id=uuid4(), name=f"Product {i}", price=float(i * 10))
+            for i in range(1, 4)
+        ]
 
+        async with DatabaseManager.transaction("test_db"):
             created = await product_repo_with_soft_delete.create_many(products)
 
             assert len(created) == 3
@@ -323,18 +360,19 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test bulk soft delete using where().delete()"""
+        # Create multiple products
+        products = [
+            Product(id=uuid4(), name=f"Product {i}", price=float(i * 10))
+            for i in range(1, 4)
+        ]
+
         async with DatabaseManager.transaction("test_db"):
-            # Create multiple products
-            products = [
-                Product(id=uuid4(), name=f"Product {i}", price=float(i * 10))
-                for i in range(1, 4)
-            ]
             created = await product_repo_with_soft_delete.create_many(products)
             ids = [p.id for p in created]
 
             # Soft delete all using where().delete()
             deleted_count = await product_repo_with_soft_delete.where_in(
-                "id", [str(id) for id in ids]
+                "id", ids
             ).delete()
 
             assert deleted_count == 3
@@ -349,19 +387,19 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test searching with category - soft deleted are auto-excluded"""
-        async with DatabaseManager.transaction("test_db"):
-            # Create active product
-            product1 = Product(
-                id=uuid4(), name="Active Product", price=50.00, category="Electronics"
-            )
-            await product_repo_with_soft_delete.create(product1)
+        # Create one active product and one to soft delete
+        product1 = Product(
+            id=uuid4(), name="Active Product", price=50.00, category="Electronics"
+        )
+        product2 = Product(
+            id=uuid4(), name="Deleted Product", price=60.00, category="Electronics"
+        )
 
-            # Create and soft delete product
-            product2 = Product(
-                id=uuid4(), name="Deleted Product", price=60.00, category="Electronics"
+        async with DatabaseManager.transaction("test_db"):
+            created = await product_repo_with_soft_delete.create_many(
+                [product1, product2]
             )
-            created2 = await product_repo_with_soft_delete.create(product2)
-            await product_repo_with_soft_delete.delete(created2.id)
+            await product_repo_with_soft_delete.delete(created[1].id)
 
             # Search for electronics - should only find active ones
             results = await product_repo_with_soft_delete.where(
@@ -375,10 +413,10 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test that deleted_at is stored as proper timestamp"""
-        async with DatabaseManager.transaction("test_db"):
-            product_id = uuid4()
-            product = Product(id=product_id, name="Test", price=10.00)
+        product_id = uuid4()
+        product = Product(id=product_id, name="Test", price=10.00)
 
+        async with DatabaseManager.transaction("test_db"):
             await product_repo_with_soft_delete.create(product)
 
             # Soft delete using delete()
@@ -401,17 +439,19 @@ class TestSoftDeleteIntegration:
         self, setup_soft_delete_table, product_repo_with_soft_delete
     ):
         """Test counting with automatic soft delete filtering"""
+        # Create 5 products
+        products = [
+            Product(id=uuid4(), name=f"Product {i}", price=float(i * 10))
+            for i in range(1, 6)
+        ]
+
         async with DatabaseManager.transaction("test_db"):
-            # Create 5 products
-            products = [
-                Product(id=uuid4(), name=f"Product {i}", price=float(i * 10))
-                for i in range(1, 6)
-            ]
             created = await product_repo_with_soft_delete.create_many(products)
 
-            # Soft delete 2 of them using delete()
-            await product_repo_with_soft_delete.delete(created[0].id)
-            await product_repo_with_soft_delete.delete(created[1].id)
+            # Soft delete 2 of them in one statement
+            await product_repo_with_soft_delete.where_in(
+                "id", [str(created[0].id), str(created[1].id)]
+            ).delete()
 
             # Count active products (default excludes soft-deleted)
             active_count = await product_repo_with_soft_delete.count()
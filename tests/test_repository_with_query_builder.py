@@ -9,12 +9,52 @@ import pytest
 
 from src.db_context import DatabaseManager, transactional
 from src.repository import Repository
-from tests.post_entities import (
-    Post as PostEntity,
-)
-from tests.post_entities import (
-    PostUpdate as PostUpdateArgs,
-)
+from tests.post_entities import Post as PostEntity
+from tests.post_entities import PostUpdate as PostUpdateArgs
+
+# Built once; tests only read these rows
+_SAMPLE_POSTS = [
+    {
+        "id": uuid4(),
+        "title": "Python Tutorial",
+        "content": "Learn Python basics",
+        "published": True,
+        "category": "tech",
+        "author_id": uuid4(),
+    },
+    {
+        "id": uuid4(),
+        "title": "JavaScript Guide",
+        "content": "Learn JavaScript fundamentals",
+        "published": True,
+        "category": "tech",
+        "author_id": uuid4(),
+    },
+    {
+        "id": uuid4(),
+        "title": "Draft Post",
+        "content": "This is a draft",
+        "published": False,
+        "category": "personal",
+        "author_id": uuid4(),
+    },
+    {
+        "id": uuid4(),
+        "title": "Cooking Tips",
+        "content": "How to cook pasta",
+        "published": True,
+        "category": "lifestyle",
+        "author_id": uuid4(),
+    },
+    {
+        "id": uuid4(),
+        "title": "Another Draft",
+        "content": "Another draft post",
+        "published": False,
+        "category": "tech",
+        "author_id": uuid4(),
+    },
+]
 
 
 class TestRepositoryWithQueryBuilder:
@@ -32,85 +72,34 @@ class TestRepositoryWithQueryBuilder:
 
     @pytest.fixture
     def sample_posts(self):
-        """Create sample test data"""
-        return [
-            {
-                "id": uuid4(),
-                "title": "Python Tutorial",
-                "content": "Learn Python basics",
-                "published": True,
-                "category": "tech",
-                "author_id": uuid4(),
-            },
-            {
-                "id": uuid4(),
-                "title": "JavaScript Guide",
-                "content": "Learn JavaScript fundamentals",
-                "published": True,
-                "category": "tech",
-                "author_id": uuid4(),
-            },
-            {
-                "id": uuid4(),
-                "title": "Draft Post",
-                "content": "This is a draft",
-                "published": False,
-                "category": "personal",
-                "author_id": uuid4(),
-            },
-            {
-                "id": uuid4(),
-                "title": "Cooking Tips",
-                "content": "How to cook pasta",
-                "published": True,
-                "category": "lifestyle",
-                "author_id": uuid4(),
-            },
-            {
-                "id": uuid4(),
-                "title": "Another Draft",
-                "content": "Another draft post",
-                "published": False,
-                "category": "tech",
-                "author_id": uuid4(),
-            },
-        ]
+        """Return the shared sample test data"""
+        return _SAMPLE_POSTS
 
     async def setup_test_data(self, sample_posts):
-        """Helper to set up test table and data"""
+        """Helper to insert the sample rows into test_posts"""
         conn = DatabaseManager.get_current_connection()
         if not conn:
             raise RuntimeError("No database connection available for test setup")
 
-        # Create test table
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS test_posts (
-                id UUID PRIMARY KEY,
-                title VARCHAR(255) NOT NULL,
-                content TEXT NOT NULL,
-                published BOOLEAN NOT NULL DEFAULT FALSE,
-                category VARCHAR(100) NOT NULL,
-                author_id UUID NOT NULL
-            )
-        """)
-
-        # Clear existing data
-        await conn.execute("DELETE FROM test_posts")
-
-        # Insert test data
-        for post in sample_posts:
-            await conn.execute(
-                """
-                INSERT INTO test_posts (id, title, content, published, category, author_id)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            """,
-                post["id"],
-                post["title"],
-                post["content"],
-                post["published"],
-                post["category"],
-                post["author_id"],
-            )
+        # test_posts is created once per session and truncated after each
+        # test by the conftest fixtures, so only the rows are inserted here
+        await conn.executemany(
+            """
+            INSERT INTO test_posts (id, title, content, published, category, author_id)
+            VALUES ($1, $2, $3, $4, $5, $6)
+        """,
+            [
+                (
+                    post["id"],
+                    post["title"],
+                    post["content"],
+                    post["published"],
+                    post["category"],
+                    post["author_id"],
+                )
+                for post in sample_posts
+            ],
+        )
 
     @pytest.mark.asyncio
     @transactional("test_db")
@@ -217,9 +206,9 @@ class TestRepositoryWithQueryBuilder:
         await self.setup_test_data(sample_posts)
 
         # Test OFFSET
-        all_posts = await repository.get()
+        total = await repository.count()
         offset_posts = await repository.offset(2).get()
-        assert len(offset_posts) == len(all_posts) - 2
+        assert len(offset_posts) == total - 2
 
     @pytest.mark.asyncio
     @transactional("test_db")
@@ -211,6 +211,35 @@ class TestQueryBuilderWithFields:
         assert params == []
 
 
+# Built once; tests only read these rows
+_SAMPLE_POSTS = [
+    {
+        "id": uuid4(),
+        "title": "Python Tutorial",
+        "content": "Learn Python basics",
+        "published": True,
+        "category": "tech",
+        "author_id": uuid4(),
+    },
+    {
+        "id": uuid4(),
+        "title": "JavaScript Guide",
+        "content": "Learn JavaScript fundamentals",
+        "published": True,
+        "category": "tech",
+        "author_id": uuid4(),
+    },
+    {
+        "id": uuid4(),
+        "title": "Draft Post",
+        "content": "This is a draft",
+        "published": False,
+        "category": "draft",
+        "author_id": uuid4(),
+    },
+]
+
+
 class TestRepositoryWithFields:
     """Test Repository with type-safe Field objects"""
 
@@ -226,33 +255,8 @@ class TestRepositoryWithFields:
 
     @pytest.fixture
     def sample_posts(self):
-        """Create sample test data"""
-        return [
-            {
-                "id": uuid4(),
-                "title": "Python Tutorial",
-                "content": "Learn Python basics",
-                "published": True,
-                "category": "tech",
-                "author_id": uuid4(),
-            },
-            {
-                "id": uuid4(),
-                "title": "JavaScript Guide",
-                "content": "Learn JavaScript fundamentals",
-                "published": True,
-                "category": "tech",
-                "author_id": uuid4(),
-            },
-            {
-                "id": uuid4(),
-                "title": "Draft Post",
-                "content": "This is a draft",
-                "published": False,
-                "category": "draft",
-                "author_id": uuid4(),
-            },
-        ]
+        """Return the shared sample test data"""
+        return _SAMPLE_POSTS
 
     async def setup_test_data(self, sample_posts):
         """Helper method to insert test data into the database"""
@@ -263,19 +267,23 @@ class TestRepositoryWithFields:
             return
 
         # Insert test data
-        for post in sample_posts:
-            await conn.execute(
-                """
-                INSERT INTO test_posts (id, title, content, published, category, author_id)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            """,
-                post["id"],
-                post["title"],
-                post["content"],
-                post["published"],
-                post["category"],
-                post["author_id"],
-            )
+        await conn.executemany(
+            """
+            INSERT INTO test_posts (id, title, content, published, category, author_id)
+            VALUES ($1, $2, $3, $4, $5, $6)
+        """,
+            [
+                (
+                    post["id"],
+                    post["title"],
+                    post["content"],
+                    post["published"],
+                    post["category"],
+                    post["author_id"],
+                )
+                for post in sample_posts
+            ],
+        )
 
     @pytest.mark.asyncio
     @transactional("test_db")
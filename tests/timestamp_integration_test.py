@@ -6,12 +6,11 @@ from datetime import datetime
 from uuid import UUID, uuid4
 
 import pytest
-import pytest_asyncio
 from pydantic import BaseModel
 
 from src.db_context import transactional
 from src.entities import BaseEntity
-from src.repository import Repository
+from src.repository import Repository, RepositoryConfig
 
 
 class TimestampedPost(BaseEntity):
@@ -65,22 +64,9 @@ class TimestampedPostUpdate(BaseModel):
 class TestTimestampIntegration:
     """Integration tests for timestamp functionality with database"""
 
-    @pytest_asyncio.fixture
-    async def timestamped_post_repo(self, test_db_pool):
+    @pytest.fixture
+    def timestamped_post_repo(self):
         """Repository with timestamps enabled for posts"""
-        async with test_db_pool.acquire() as conn:
-            # Create table with timestamp columns
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS timestamped_posts (
-                    id UUID PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    content TEXT,
-                    published BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP WITH TIME ZONE,
-                    updated_at TIMESTAMP WITH TIME ZONE
-                )
-            """)
-
         return Repository(
             entity_schema_class=TimestampedPost,
             entity_domain_class=TimestampedPost,
@@ -88,20 +74,9 @@ class TestTimestampIntegration:
             table_name="timestamped_posts",
         )
 
-    @pytest_asyncio.fixture
-    async def non_timestamped_post_repo(self, test_db_pool):
+    @pytest.fixture
+    def non_timestamped_post_repo(self):
         """Repository without timestamps for posts"""
-        async with test_db_pool.acquire() as conn:
-            # Create table without timestamp columns
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS non_timestamped_posts (
-                    id UUID PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    content TEXT,
-                    published BOOLEAN DEFAULT FALSE
-                )
-            """)
-
         return Repository(
             entity_schema_class=NonTimestampedPost,
             entity_domain_class=NonTimestampedPost,
@@ -109,24 +84,9 @@ class TestTimestampIntegration:
             table_name="non_timestamped_posts",
         )
 
-    @pytest_asyncio.fixture
-    async def timestamped_schema_non_timestamped_domain_repo(self, test_db_pool):
+    @pytest.fixture
+    def timestamped_schema_non_timestamped_domain_repo(self):
         """Repository where schema has timestamps but domain does not."""
-        async with test_db_pool.acquire() as conn:
-            # Ensure table with timestamp columns exists
-            await conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS timestamped_posts (
-                    id UUID PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    content TEXT,
-                    published BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP WITH TIME ZONE,
-                    updated_at TIMESTAMP WITH TIME ZONE
-                )
-                """
-            )
-
         return Repository(
             entity_schema_class=TimestampedPost,  # includes timestamps
             entity_domain_class=BusinessPost,  # does NOT include timestamps
@@ -145,8 +105,8 @@ class TestTimestampIntegration:
         created_post = await timestamped_post_repo.create(post)
 
         # Verify timestamps were added
-        assert hasattr(created_post, "created_at")
-        assert hasattr(created_post, "updated_at")
+        assert created_post.created_at is not None
+        assert created_post.updated_at is not None
         assert created_post.created_at == created_post.updated_at
 
         # Verify timestamp format
@@ -192,13 +152,16 @@ class TestTimestampIntegration:
         assert len(created_posts) == 3
 
         for post in created_posts:
-            assert hasattr(post, "created_at")
-            assert hasattr(post, "updated_at")
+            assert post.created_at is not None
+            assert post.updated_at is not None
             assert post.created_at == post.updated_at
 
+        # The whole batch is stamped with a single timestamp
+        assert len({post.created_at for post in created_posts}) == 1
+
     @pytest.mark.asyncio
     @transactional("test_db")
-    async def test_update_with_timestamps(self, timestamped_post_repo):
+    async def test_update_with_timestamps(self, timestamped_post_repo, advancing_clock):
         """Test updating an entity with automatic timestamp update"""
         # Create initial post
         post = TimestampedPost(
@@ -211,11 +174,6 @@ class TestTimestampIntegration:
         original_created_at = created_post.created_at
         original_updated_at = created_post.updated_at
 
-        # Wait a small amount to ensure timestamp difference
-        import time
-
-        time.sleep(0.001)
-
         # Update the post
         update_data = TimestampedPostUpdate(title="Updated Title", published=True)
         updated_post = await timestamped_post_repo.update(created_post.id, update_data)
@@ -247,8 +205,31 @@ class TestTimestampIntegration:
         assert found_post is not None
         assert found_post.id == created_post.id
         assert found_post.title == "Find Test Post"
-        assert hasattr(found_post, "created_at")
-        assert hasattr(found_post, "updated_at")
+        assert found_post.created_at is not None
+        assert found_post.updated_at is not None
+
+    @pytest.mark.asyncio
+    @transactional("test_db")
+    async def test_find_by_id_with_trusted_rows(self):
+        """Test that rows built without validation keep aware datetimes"""
+        trusted_repo = Repository(
+            entity_schema_class=TimestampedPost,
+            entity_domain_class=TimestampedPost,
+            update_class=TimestampedPostUpdate,
+            table_name="timestamped_posts",
+            config=RepositoryConfig(trust_db_rows=True),
+        )
+        post = TimestampedPost(id=uuid4(), title="Trusted", content="Row")
+        created_post = await trusted_repo.create(post)
+
+        found_post = await trusted_repo.find_by_id(created_post.id)
+
+        assert found_post is not None
+        assert found_post.id == created_post.id
+        assert found_post.title == "Trusted"
+        assert isinstance(found_post.created_at, datetime)
+        assert found_post.created_at.tzinfo is not None
+        assert found_post.created_at == created_post.created_at
 
     @pytest.mark.asyncio
     @transactional("test_db")
@@ -269,12 +250,14 @@ class TestTimestampIntegration:
         assert len(found_posts) == 1
         found_post = found_posts[0]
         assert found_post.title == "Search Post 1"
-        assert hasattr(found_post, "created_at")
-        assert hasattr(found_post, "updated_at")
+        assert found_post.created_at is not None
+        assert found_post.updated_at is not None
 
     @pytest.mark.asyncio
     @transactional("test_db")
-    async def test_timestamp_consistency_across_operations(self, timestamped_post_repo):
+    async def test_timestamp_consistency_across_operations(
+        self, timestamped_post_repo, advancing_clock
+    ):
         """Test that timestamps remain consistent across operations"""
         post = TimestampedPost(
             id=uuid4(),
@@ -293,9 +276,6 @@ class TestTimestampIntegration:
         assert found_post.updated_at == updated_at
 
         # Update
-        import time
-
-        time.sleep(0.001)
         update_data = TimestampedPostUpdate(title="Updated Consistency Test")
         updated_post = await timestamped_post_repo.update(created_post.id, update_data)
 
@@ -331,7 +311,7 @@ class TestTimestampIntegration:
     @pytest.mark.asyncio
     @transactional("test_db")
     async def test_schema_timestamps_domain_without_fields(
-        self, timestamped_schema_non_timestamped_domain_repo
+        self, timestamped_schema_non_timestamped_domain_repo, advancing_clock
     ):
         """When schema has timestamps but domain model doesn't, repository still injects timestamps and they are accessible."""
         post = BusinessPost(id=uuid4(), title="Biz Post", content="Biz content")
@@ -344,9 +324,6 @@ class TestTimestampIntegration:
         assert isinstance(created.updated_at, datetime)
         assert created.created_at == created.updated_at
 
-        import time
-
-        time.sleep(0.001)
         updated = await timestamped_schema_non_timestamped_domain_repo.update(
             created.id, TimestampedPostUpdate(title="Biz Updated")
         )
@@ -155,16 +155,13 @@ class TestTimestampFunctionality:
         assert "updated_at" in injected_data
 
     def test_multiple_timestamp_calls_produce_different_timestamps(
-        self, timestamped_repo
+        self, timestamped_repo, advancing_clock
     ):
         """Test that multiple calls produce different timestamps"""
-        import time
-
         data1 = {"name": "Entity 1"}
         data2 = {"name": "Entity 2"}
 
         injected1 = timestamped_repo._apply_automatic_fields(data1, is_create=True)
-        time.sleep(0.001)  # Small delay to ensure different timestamps
         injected2 = timestamped_repo._apply_automatic_fields(data2, is_create=True)
 
         assert injected1["created_at"] != injected2["created_at"]